@@ -7,3 +7,9 @@ CREATE TABLE IF NOT EXISTS items (
 );
 
 CREATE INDEX IF NOT EXISTS idx_items_name ON items(name);
+
+-- Name search (GET /api/v1/items/search): prefix matches range-scan the byte-ordered
+-- index, substring matches use the trigram index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_items_name_c ON items (name COLLATE "C");
+CREATE INDEX IF NOT EXISTS idx_items_name_trgm ON items USING gin (name gin_trgm_ops);
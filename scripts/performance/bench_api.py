@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Drive the main API routes at fixed concurrency and record latency and throughput.
+
+The app runs with the in-memory items backend and rate limiting off, so no
+Postgres is needed; Redis is not needed either (the readiness report simply
+says "not ready"). With --mode inprocess requests go through httpx's ASGI
+transport; with --mode uvicorn a single uvicorn worker is spawned and driven
+over TCP.
+
+Each scenario's p50/p95/p99 latency, requests/sec and error count are written
+as JSON to --output. With --baseline, every scenario is compared against a
+stored result and the exit status is 1 if p99 rose or requests/sec fell by
+more than --tolerance percent.
+
+Usage:
+    python scripts/performance/bench_api.py [--mode inprocess|uvicorn] [--concurrency 20]
+        [--requests 2000] [--output reports/benchmark.json]
+        [--baseline reports/benchmark-baseline.json] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+# Stand-ins for the external services, set before the app reads its settings
+os.environ.setdefault("ITEMS_BACKEND", "memory")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+from src.app.config import settings  # noqa: E402
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+HEADERS = {"X-API-Key": settings.API_KEY, "Accept-Encoding": "gzip"}
+
+
+def scenarios(ids: list[int]) -> dict[str, Request]:
+    """
+    Request factories by scenario name; ``i`` is the request's index in its run.
+
+    Created item ids are appended to ``ids`` so that get/update/delete hit
+    existing items.
+    """
+
+    async def create(client: httpx.AsyncClient, i: int) -> httpx.Response:
+        response = await client.post("/api/v1/items", json={"name": f"bench-{i}"}, headers=HEADERS)
+        if response.is_success:
+            ids.append(response.json()["id"])
+        return response
+
+    return {
+        "health_live": lambda client, _: client.get("/health/live"),
+        "health_ready": lambda client, _: client.get("/health/ready"),
+        "landing": lambda client, _: client.get("/", headers=HEADERS),
+        "items_create": create,
+        "items_list": lambda client, _: client.get(
+            "/api/v1/items", params={"skip": 0, "limit": 100}, headers=HEADERS
+        ),
+        "items_get": lambda client, i: client.get(
+            f"/api/v1/items/{ids[i % len(ids)]}", headers=HEADERS
+        ),
+        "items_update": lambda client, i: client.put(
+            f"/api/v1/items/{ids[i % len(ids)]}", json={"name": f"bench-{i}-v2"}, headers=HEADERS
+        ),
+        "items_delete": lambda client, i: client.delete(f"/api/v1/items/{ids[i]}", headers=HEADERS),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, request: Request, total: int, concurrency: int
+) -> dict[str, float]:
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index, errors
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            start = time.perf_counter()
+            response = await request(client, index)
+            latencies.append(time.perf_counter() - start)
+            errors += response.is_error
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+@asynccontextmanager
+async def inprocess_client() -> AsyncIterator[httpx.AsyncClient]:
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+    from src.app.main import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(port: int) -> AsyncIterator[httpx.AsyncClient]:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.app.main:app", "--port", str(port)],  # noqa: S603
+        cwd=ROOT,
+        env={**os.environ, "APP_LOG_LEVEL": "WARNING"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+            for _ in range(300):
+                try:
+                    if (await client.get("/health/live")).is_success:
+                        break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn did not become ready")
+            yield client
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+async def run_suite(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    client_context = inprocess_client() if args.mode == "inprocess" else uvicorn_client(args.port)
+    results: dict[str, dict[str, float]] = {}
+    async with client_context as client:
+        ids: list[int] = []
+        requests = scenarios(ids)
+        # Warm up every route that does not remove items
+        for name in ("items_create", "health_live", "landing", "items_list", "items_get"):
+            for i in range(args.warmup):
+                await requests[name](client, i)
+        ids.clear()
+
+        for name, request in requests.items():
+            results[name] = await run_scenario(client, request, args.requests, args.concurrency)
+            result = results[name]
+            print(
+                f"{name:<14} {result['rps']:>9,.0f} req/s  p50 {result['p50_ms']:>8.3f}"
+                f"  p95 {result['p95_ms']:>8.3f}  p99 {result['p99_ms']:>8.3f} ms"
+                f"  errors {result['errors']:.0f}"
+            )
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S603, S607
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float
+) -> list[str]:
+    """Describe every scenario whose p99 or requests/sec regressed beyond ``tolerance`` percent."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        p99_change = (current["p99_ms"] / previous["p99_ms"] - 1) * 100
+        rps_change = (current["rps"] / previous["rps"] - 1) * 100
+        if p99_change > tolerance:
+            regressions.append(
+                f"{name}: p99 {previous['p99_ms']} -> {current['p99_ms']} ms (+{p99_change:.1f}%)"
+            )
+        if rps_change < -tolerance:
+            regressions.append(
+                f"{name}: {previous['rps']} -> {current['rps']} req/s ({rps_change:.1f}%)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--port", type=int, default=18082)
+    parser.add_argument("--output", type=Path, default=ROOT / "reports" / "benchmark.json")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="percent")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite(args))
+    report: dict[str, Any] = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "mode": args.mode,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "scenarios": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"report written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if (baseline["mode"], baseline["concurrency"]) != (args.mode, args.concurrency):
+        print("warning: baseline was recorded with a different mode or concurrency")
+    regressions = compare(results, baseline["scenarios"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"no regressions beyond {args.tolerance:.0f}% against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Measure authenticated requests/sec with plaintext and bcrypt-hashed API keys.
+
+GET /api/v1/items/{id} is driven through the full app via httpx's ASGI
+transport, each of --concurrency workers with its own key, in three setups:
+the single plaintext API_KEY, hashed keys with a warm verification cache, and
+hashed keys with a cold cache (API_KEY_CACHE_TTL=0, so every request runs
+bcrypt at --rounds).
+
+Usage:
+    python scripts/performance/bench_api_keys.py [--requests 2000] [--concurrency 20] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import structlog
+from passlib.hash import bcrypt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+os.environ.setdefault("ITEMS_BACKEND", "memory")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["OTEL_ENABLED"] = "false"
+
+from src.app.api import views  # noqa: E402
+from src.app.auth import ApiKeyRegistry  # noqa: E402
+from src.app.config import settings  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+
+
+async def drive(keys: list[str], total: int) -> tuple[float, list[float]]:
+    transport = httpx.ASGITransport(app=create_app())
+    latencies: list[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post(
+            "/api/v1/items", json={"name": "auth"}, headers={"X-API-Key": keys[0]}
+        )
+        response.raise_for_status()
+        url = f"/api/v1/items/{response.json()['id']}"
+        remaining = total
+
+        async def worker(key: str) -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await client.get(url, headers={"X-API-Key": key})
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(key) for key in keys))
+    return time.perf_counter() - start, latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--cold-requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+    hasher = bcrypt.using(rounds=args.rounds)
+    secrets = {f"client{i}": f"secret-{i}" for i in range(args.concurrency)}
+    hashed_keys = [f"{key_id}.{secret}" for key_id, secret in secrets.items()]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as registry_file:
+        json.dump(
+            {key_id: hasher.hash(secret) for key_id, secret in secrets.items()}, registry_file
+        )
+        registry_file.flush()
+        runs = [
+            ("plaintext API_KEY", [settings.API_KEY] * args.concurrency, {}, args.requests),
+            ("hashed, warm cache", hashed_keys, {}, args.requests),
+            ("hashed, cold cache", hashed_keys, {"API_KEY_CACHE_TTL": 0}, args.cold_requests),
+        ]
+        for name, keys, overrides, total in runs:
+            config = settings.model_copy(update={"API_KEYS_FILE": registry_file.name, **overrides})
+            views.api_keys = ApiKeyRegistry(config)
+            asyncio.run(drive(keys, args.concurrency))  # warm-up: one request per key
+            elapsed, latencies = asyncio.run(drive(keys, total))
+            cuts = statistics.quantiles(latencies, n=100)
+            print(
+                f"{name:>18}: {total / elapsed:>8,.0f} req/s  p50 {cuts[49] * 1000:>7.2f}"
+                f"  p99 {cuts[98] * 1000:>7.2f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
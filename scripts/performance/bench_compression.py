@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Report bandwidth saved and CPU spent per compression coding and level.
+
+Two payloads are encoded with the same encoders CompressionMiddleware uses:
+a 1,000-item JSON page in one shot, and a 10,000-item NDJSON export in
+ITEMS_EXPORT_CHUNK_SIZE chunks with a flush after each chunk, as streamed
+responses are. brotli and zstd rows appear only when those packages are installed.
+
+Usage:
+    python scripts/performance/bench_compression.py [--rounds 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app.compression import ENCODERS  # noqa: E402
+from src.app.config import settings  # noqa: E402
+from src.app.models import Item  # noqa: E402
+from src.app.repositories import item_list_adapter  # noqa: E402
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 6, 11], "zstd": [1, 3, 9, 19]}
+
+
+def payloads() -> dict[str, list[bytes]]:
+    items = [Item(id=i, name=f"item-{i}") for i in range(10_000)]
+    page = item_list_adapter.dump_json(items[:1_000])
+    chunk_size = settings.ITEMS_EXPORT_CHUNK_SIZE
+    export = [
+        b"".join(item.model_dump_json().encode() + b"\n" for item in items[i : i + chunk_size])
+        for i in range(0, len(items), chunk_size)
+    ]
+    return {"page (1k items)": [page], "export (10k, streamed)": export}
+
+
+def encode(coding: str, level: int, chunks: list[bytes]) -> int:
+    encoder = ENCODERS[coding](level)
+    size = 0
+    for index, chunk in enumerate(chunks):
+        size += len(encoder.compress(chunk))
+        size += len(encoder.finish() if index == len(chunks) - 1 else encoder.flush())
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"available codings: {', '.join(ENCODERS)}")
+    for name, chunks in payloads().items():
+        original = sum(len(chunk) for chunk in chunks)
+        print(f"\n{name}: {original / 1024:,.0f} KiB")
+        print(f"{'coding':>8} {'level':>5} {'KiB':>8} {'ratio':>6} {'CPU ms':>8} {'MB/s':>8}")
+        for coding in ENCODERS:
+            for level in LEVELS[coding]:
+                cpu = float("inf")
+                for _ in range(args.rounds):
+                    start = time.process_time()
+                    size = encode(coding, level, chunks)
+                    cpu = min(cpu, time.process_time() - start)
+                print(
+                    f"{coding:>8} {level:>5} {size / 1024:>8,.1f} {original / size:>6.1f} "
+                    f"{cpu * 1000:>8.2f} {original / cpu / 1e6:>8,.0f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the in-memory ItemsRepository.
+
+Usage:
+    python scripts/performance/bench_items_repository.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app.models import Item  # noqa: E402
+from src.app.repositories import ItemsRepository  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+OPERATIONS = 10_000
+
+
+async def build_repository(size: int) -> ItemsRepository:
+    repo = ItemsRepository()
+    for i in range(size):
+        await repo.add_item(Item(name=f"item-{i}"))
+    return repo
+
+
+async def ops_per_second(operation: Callable[[int], Awaitable[object]], ids: list[int]) -> float:
+    start = time.perf_counter()
+    for item_id in ids:
+        await operation(item_id)
+    return len(ids) / (time.perf_counter() - start)
+
+
+async def run(size: int) -> dict[str, float]:
+    repo = await build_repository(size)
+    rng = random.Random(size)
+    ids = rng.sample(range(1, size + 1), OPERATIONS)
+    replacement = Item(name="updated")
+
+    return {
+        "get": await ops_per_second(repo.get_item, ids),
+        "update": await ops_per_second(lambda item_id: repo.update_item(item_id, replacement), ids),
+        "list_first_page": await ops_per_second(lambda _: repo.get_items(0, 10), ids),
+        "list_deep_page": await ops_per_second(lambda _: repo.get_items(size // 2, 10), ids),
+        "delete": await ops_per_second(repo.delete_item, ids),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>10} {'get/s':>12} {'update/s':>12} {'list/s':>12} {'deep list/s':>12}"
+        f" {'delete/s':>12}"
+    )
+    for size in args.sizes:
+        result = asyncio.run(run(size))
+        print(
+            f"{size:>10} {result['get']:>12,.0f} {result['update']:>12,.0f} "
+            f"{result['list_first_page']:>12,.0f} {result['list_deep_page']:>12,.0f}"
+            f" {result['delete']:>12,.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare GET /api/v1/items latency with and without FEATURE_FAST_JSON.
+
+The in-memory repository is filled with the largest page size, then each page
+size is requested through the full app (middleware included) via httpx's ASGI
+transport: once with the default response_model path (revalidation plus
+jsonable_encoder) and once with TypeAdapter serialization. The raw serializer
+cost of each approach is printed alongside, including orjson when installed.
+
+Usage:
+    python scripts/performance/bench_json_responses.py [--sizes 10 1000 10000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app.api import views  # noqa: E402
+from src.app.config import settings  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+from src.app.models import Item  # noqa: E402
+from src.app.repositories import item_list_adapter  # noqa: E402
+
+
+def best_of(rounds: int, func: Callable[[], Any]) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+async def request_latency(size: int, rounds: int, *, fast: bool) -> float:
+    settings.FEATURE_FAST_JSON = fast
+    transport = httpx.ASGITransport(app=create_app())
+    headers = {"X-API-Key": settings.API_KEY}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        params = {"limit": size}
+        (await client.get("/api/v1/items", params=params, headers=headers)).raise_for_status()
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            response = await client.get("/api/v1/items", params=params, headers=headers)
+            samples.append(time.perf_counter() - start)
+            assert len(response.json()) == size  # noqa: S101
+    return statistics.median(samples)
+
+
+def serializers(items: list[Item]) -> dict[str, Callable[[], Any]]:
+    candidates = {
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(items)).encode(),
+        "TypeAdapter": lambda: item_list_adapter.dump_json(items),
+    }
+    if find_spec("orjson") is not None:
+        import orjson
+
+        candidates["orjson(model_dump)"] = lambda: orjson.dumps(
+            [item.model_dump() for item in items]
+        )
+    return candidates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+    settings.RATE_LIMIT_ENABLED = False
+    settings.METRICS_ENABLED = False
+    items = [Item(name=f"item-{i}") for i in range(max(args.sizes))]
+    asyncio.run(views.items_repo.add_items(items))
+
+    for size in args.sizes:
+        before = asyncio.run(request_latency(size, args.rounds, fast=False)) * 1000
+        after = asyncio.run(request_latency(size, args.rounds, fast=True)) * 1000
+        print(
+            f"page {size:>6}: response_model {before:>9.3f} ms  fast {after:>9.3f} ms  "
+            f"{before / after:>5.2f}x"
+        )
+        for name, func in serializers(items[:size]).items():
+            print(f"{'':>13}{name:<20}{best_of(args.rounds, func) * 1000:>9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare the cost of verifying JWT bearer tokens with and without caching.
+
+For RS256 and ES256 tokens this times, per verification: parsing the JWK and
+verifying (no caching at all), verifying with the parsed key (what a
+JwtVerifier cache miss does), a JwtVerifier miss end to end (JWT_CACHE_TTL=0)
+and a JwtVerifier hit on the verified-token cache.
+
+Usage:
+    python scripts/performance/bench_jwt.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import jwt
+import structlog
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jwt.algorithms import ECAlgorithm, RSAAlgorithm
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app.auth import JwtVerifier  # noqa: E402
+from src.app.config import settings  # noqa: E402
+
+
+def per_call_us(func: Callable[[], Any], iterations: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best * 1e6
+
+
+def verifications(
+    token: str, jwk: dict[str, Any], algorithm: str, cached: JwtVerifier, uncached: JwtVerifier
+) -> list[Callable[[], Any]]:
+    public_key = jwt.PyJWK.from_dict(jwk).key
+    return [
+        lambda: jwt.decode(token, jwt.PyJWK.from_dict(jwk).key, algorithms=[algorithm]),
+        lambda: jwt.decode(token, public_key, algorithms=[algorithm]),
+        lambda: uncached.verify(token),
+        lambda: cached.verify(token),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    private_keys: dict[str, rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey] = {
+        "RS256": rsa_key,
+        "ES256": ec_key,
+    }
+    jwks = [
+        RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True),
+        ECAlgorithm.to_jwk(ec_key.public_key(), as_dict=True),
+    ]
+    for jwk, algorithm in zip(jwks, private_keys, strict=True):
+        jwk.update(kid=algorithm, alg=algorithm)
+    claims = {"sub": "bench", "exp": int(time.time()) + 3600}
+
+    cached = JwtVerifier(settings.model_copy(update={"JWT_JWKS": json.dumps({"keys": jwks})}))
+    uncached = JwtVerifier(
+        settings.model_copy(update={"JWT_JWKS": json.dumps({"keys": jwks}), "JWT_CACHE_TTL": 0})
+    )
+
+    print(f"{'':>6} {'parse + verify':>15} {'parsed key':>11} {'cache miss':>11} {'cache hit':>10}")
+    for jwk, (algorithm, private_key) in zip(jwks, private_keys.items(), strict=True):
+        token = jwt.encode(claims, private_key, algorithm=algorithm, headers={"kid": algorithm})
+        cached.verify(token)
+        timings = [
+            per_call_us(call, args.iterations, args.rounds)
+            for call in verifications(token, jwk, algorithm, cached, uncached)
+        ]
+        print(f"{algorithm:>6} " + " ".join(f"{t:>10.1f} us" for t in timings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Measure request latency with synchronous and queue-backed access logging.
+
+GET /api/v1/items/{id} is driven through the full app at --concurrency via
+httpx's ASGI transport while access logs are written as JSON to a temporary
+file: rendered and written on the event loop (structlog's PrintLogger), through
+the QueueSink writer thread, and through the QueueSink with successful requests
+sampled at --sample-rate. --flush-delay-ms stalls every flush to stand in for a
+slow log destination. Dropped events are reported for the queued runs.
+
+Usage:
+    python scripts/performance/bench_logging.py [--requests 5000] [--concurrency 20]
+        [--sample-rate 0.1] [--flush-delay-ms 0]
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TextIO
+
+import httpx
+import structlog
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+os.environ.setdefault("ITEMS_BACKEND", "memory")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["OTEL_ENABLED"] = "false"
+
+from src.app.config import settings  # noqa: E402
+from src.app.logs import QueueSink, configure_logging, log_events_dropped  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+
+class SlowFile(io.TextIOWrapper):
+    """A log file whose every flush stalls, like a pipe to a backed-up log collector."""
+
+    delay = 0.0
+
+    def flush(self) -> None:
+        super().flush()
+        time.sleep(self.delay)
+
+
+def configure_sync(stream: TextIO) -> None:
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(20),
+        logger_factory=structlog.PrintLoggerFactory(stream),
+    )
+
+
+async def drive(total: int, concurrency: int) -> list[float]:
+    transport = httpx.ASGITransport(app=create_app())
+    latencies: list[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/v1/items", json={"name": "logged"}, headers=HEADERS)
+        url = f"/api/v1/items/{response.json()['id']}"
+        remaining = total
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                await client.get(url, headers=HEADERS)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def dropped_total() -> float:
+    return sum(
+        sample.value
+        for metric in log_events_dropped.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_total")
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    parser.add_argument("--queue-size", type=int, default=settings.LOG_QUEUE_SIZE)
+    parser.add_argument("--flush-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    SlowFile.delay = args.flush_delay_ms / 1000
+
+    settings.LOG_FORMAT = "json"
+    settings.LOG_QUEUE_SIZE = args.queue_size
+    runs = [
+        ("sync", None),
+        ("queued", 1.0),
+        (f"queued, sampled {args.sample_rate:g}", args.sample_rate),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, sample_rate in runs:
+            with SlowFile(open(Path(directory) / "access.log", "wb")) as stream:
+                sink: QueueSink | None = None
+                if sample_rate is None:
+                    configure_sync(stream)
+                else:
+                    sink = configure_logging(stream=stream)
+                settings.LOG_ACCESS_SAMPLE_RATE = sample_rate or 1.0
+                dropped_before = dropped_total()
+
+                asyncio.run(drive(200, args.concurrency))  # warm-up
+                start = time.perf_counter()
+                latencies = asyncio.run(drive(args.requests, args.concurrency))
+                elapsed = time.perf_counter() - start
+                if sink is not None:
+                    sink.close()
+
+            lines = len((Path(directory) / "access.log").read_text().splitlines())
+            cuts = statistics.quantiles(latencies, n=100)
+            print(
+                f"{name:>22}: {args.requests / elapsed:>8,.0f} req/s  p50 {cuts[49] * 1000:>6.2f}"
+                f"  p99 {cuts[98] * 1000:>6.2f} ms  {lines:>6} lines"
+                f"  dropped {dropped_total() - dropped_before:.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Compare /health/live throughput with the BaseHTTPMiddleware and pure-ASGI middleware.
+
+The "before" app swaps the pure-ASGI MetricsMiddleware and LoggingMiddleware for
+their previous BaseHTTPMiddleware implementations; everything else in the stack
+(CORS, OpenTelemetry, routers) is identical. Requests are driven in-process
+through httpx's ASGI transport, and log output is discarded after formatting.
+
+Usage:
+    python scripts/performance/bench_middleware.py [--requests 5000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app import middleware  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+
+logger = structlog.get_logger(__name__)
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        duration = time.time() - start_time
+        middleware.request_duration.labels(
+            method=request.method,
+            endpoint=request.url.path,
+            status_class=f"{response.status_code // 100}xx",
+        ).observe(duration)
+        return response
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        client_ip = request.client.host if request.client else None
+        logger.info(
+            "request_started", method=request.method, path=request.url.path, client_ip=client_ip
+        )
+        response = await call_next(request)
+        logger.info(
+            "request_completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+        )
+        return response
+
+
+LEGACY: dict[Any, Any] = {
+    middleware.MetricsMiddleware: LegacyMetricsMiddleware,
+    middleware.LoggingMiddleware: LegacyLoggingMiddleware,
+}
+
+
+def legacy_app() -> FastAPI:
+    app = create_app()
+    app.user_middleware = [
+        Middleware(LEGACY[entry.cls], *entry.args, **entry.kwargs) if entry.cls in LEGACY else entry
+        for entry in app.user_middleware
+    ]
+    return app
+
+
+async def requests_per_second(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get("/health/live")
+
+        remaining = total
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get("/health/live")
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+
+    results: dict[str, float] = {}
+    for name, factory in (("before", legacy_app), ("after", create_app)):
+        results[name] = max(
+            asyncio.run(requests_per_second(factory(), args.requests, args.concurrency))
+            for _ in range(args.rounds)
+        )
+        print(f"{name:>8}: {results[name]:>10,.0f} req/s")
+    print(f"{'speedup':>8}: {results['after'] / results['before']:>10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
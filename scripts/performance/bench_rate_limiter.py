@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Measure per-request rate limiter overhead and fail if p99 exceeds the budget.
+
+Without --redis-url only the in-process token-bucket fallback is measured. With
+--redis-url the shared Redis sliding window is measured as well; that figure
+includes one network round trip to the given server.
+
+Usage:
+    python scripts/performance/bench_rate_limiter.py [--redis-url redis://localhost:6379/1]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.app.config import Settings  # noqa: E402
+from src.app.db.redis_pool import RedisPool  # noqa: E402
+from src.app.ratelimit import Rate, RateLimiter, TokenBucketLimiter, client_key  # noqa: E402
+
+
+def percentiles(samples: list[float]) -> tuple[float, float]:
+    cuts = statistics.quantiles(samples, n=100)
+    return cuts[49], cuts[98]
+
+
+def bench_local(rate: Rate, requests: int, clients: int) -> list[float]:
+    limiter = TokenBucketLimiter(rate)
+    keys = [client_key(None, f"10.0.{i // 256}.{i % 256}") for i in range(clients)]
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        limiter.hit(keys[i % clients])
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_redis(rate: Rate, requests: int, clients: int, redis_url: str) -> list[float]:
+    pool = RedisPool(Settings(REDIS_URL=redis_url))
+    pool.open()
+    limiter = RateLimiter(rate, pool=pool)
+    keys = [client_key(f"bench-key-{i}", None) for i in range(clients)]
+    samples = []
+    try:
+        await limiter.hit(keys[0])
+        for i in range(requests):
+            start = time.perf_counter()
+            await limiter.hit(keys[i % clients])
+            samples.append(time.perf_counter() - start)
+    finally:
+        await pool.close()
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", default="100/minute")
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--clients", type=int, default=1_000)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    rate = Rate.parse(args.rate)
+    runs = {"local": bench_local(rate, args.requests, args.clients)}
+    if args.redis_url:
+        runs["redis"] = asyncio.run(bench_redis(rate, args.requests, args.clients, args.redis_url))
+
+    within_budget = True
+    for name, samples in runs.items():
+        p50, p99 = (value * 1000 for value in percentiles(samples))
+        within_budget &= p99 <= args.budget_ms
+        print(f"{name:>6}: p50 {p50:.4f} ms  p99 {p99:.4f} ms  (budget {args.budget_ms} ms)")
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Measure /health/live throughput of the production server at several worker counts.
+
+Each run starts ``python -m src.app.server`` with SERVER_WORKERS set, drives it
+over real HTTP from --clients load-generator processes for --duration seconds
+and stops it with SIGTERM. The load generators share the host with the server,
+so leave them enough CPUs (or point --clients at a small number) when reading
+the per-core figures.
+
+Usage:
+    python scripts/performance/bench_server_scaling.py [--workers 1 2 4] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[2]
+URL = "http://127.0.0.1:{port}/health/live"
+
+
+async def drive(url: str, concurrency: int, duration: float) -> int:
+    completed = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+
+        async def worker() -> None:
+            nonlocal completed
+            while time.monotonic() < deadline:
+                response = await client.get(url)
+                response.raise_for_status()
+                completed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return completed
+
+
+def load_process(args: tuple[str, int, float]) -> int:
+    return asyncio.run(drive(*args))
+
+
+def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).is_success:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server did not become ready at {url}")
+
+
+def measure(workers: int, port: int, clients: int, concurrency: int, duration: float) -> float:
+    env = {
+        **os.environ,
+        "APP_PORT": str(port),
+        "APP_LOG_LEVEL": "WARNING",
+        "SERVER_WORKERS": str(workers),
+        "SERVER_MAX_REQUESTS": "0",
+        "RATE_LIMIT_ENABLED": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.app.server"],  # noqa: S603
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = URL.format(port=port)
+    try:
+        wait_until_ready(url)
+        # Let every worker finish its startup before measuring
+        time.sleep(1)
+        with multiprocessing.Pool(clients) as pool:
+            counts = pool.map(load_process, [(url, concurrency, duration)] * clients)
+        return sum(counts) / duration
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    print(f"host CPUs: {os.cpu_count()}")
+    baseline = None
+    for workers in args.workers:
+        rps = measure(workers, args.port, args.clients, args.concurrency, args.duration)
+        baseline = baseline or rps
+        print(
+            f"{workers:>3} workers: {rps:>10,.0f} req/s"
+            f"  {rps / workers:>8,.0f} req/s per worker  {rps / baseline:>5.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Measure cold-start cost and fail when importing the app exceeds its budget.
+
+Two figures are taken in fresh interpreters, median of --rounds runs:
+
+* import time: the cumulative ``-X importtime`` figure for ``src.app.main``
+* time to first successful ``GET /health/live`` after spawning a single uvicorn
+  worker, which adds app construction, lifespan startup and the first request
+
+The exit status is 1 when the median import time exceeds --import-budget-ms
+(default: the IMPORT_BUDGET_MS environment variable, else 1200).
+
+Usage:
+    python scripts/performance/bench_startup.py [--rounds 5] [--import-budget-ms 1200]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[2]
+MODULE = "src.app.main"
+
+
+def import_time_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],  # noqa: S603
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == MODULE:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"{MODULE} missing from -X importtime output")
+
+
+def first_response_ms(port: int, timeout: float = 30.0) -> float:
+    url = f"http://127.0.0.1:{port}/health/live"
+    env = {**os.environ, "APP_LOG_LEVEL": "WARNING"}
+    # One client for all polls, sleeping between them, so that polling steals as
+    # little CPU as possible from the starting server
+    with httpx.Client() as client:
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", f"{MODULE}:app", "--port", str(port)],  # noqa: S603
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while time.perf_counter() - start < timeout:
+                try:
+                    if client.get(url).is_success:
+                        return (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    time.sleep(0.01)
+            raise RuntimeError(f"no successful response from {url} within {timeout}s")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=18081)
+    parser.add_argument(
+        "--import-budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "1200"))
+    )
+    args = parser.parse_args()
+
+    imports = statistics.median(import_time_ms() for _ in range(args.rounds))
+    first = statistics.median(first_response_ms(args.port) for _ in range(args.rounds))
+
+    print(f"import {MODULE}: {imports:>8.1f} ms  (budget {args.import_budget_ms:.0f} ms)")
+    print(f"first /health/live: {first:>8.1f} ms")
+    if imports > args.import_budget_ms:
+        print("import time budget exceeded")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Measure per-request tracing overhead at several sampling ratios.
+
+GET /api/v1/items/{id} is driven sequentially through the full app via httpx's
+ASGI transport with tracing off, with the no-op tracer (OTEL_EXPORTER=none), and
+with the SDK provider at each --ratios value. Sampled spans go through the real
+BatchSpanProcessor to an exporter that discards them, so the figures include
+span creation and queueing but no network I/O. Overhead is reported against
+the tracing-off run.
+
+Usage:
+    python scripts/performance/bench_tracing.py [--ratios 0 0.01 1.0] [--requests 3000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import httpx
+import structlog
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+from src.app import tracing  # noqa: E402
+from src.app.config import settings  # noqa: E402
+from src.app.main import create_app  # noqa: E402
+
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+
+class DiscardingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.exported = 0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.exported += len(spans)
+        return SpanExportResult.SUCCESS
+
+
+async def per_request_us(total: int, rounds: int) -> float:
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    best = float("inf")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/v1/items", json={"name": "traced"}, headers=HEADERS)
+        url = f"/api/v1/items/{response.json()['id']}"
+        for _ in range(200):
+            await client.get(url, headers=HEADERS)
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(total):
+                await client.get(url, headers=HEADERS)
+            best = min(best, (time.perf_counter() - start) / total)
+    if provider := getattr(app.state, "tracer_provider", None):
+        provider.shutdown()
+    return best * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ratios", type=float, nargs="+", default=[0.0, 0.01, 1.0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w")))
+    exporter = DiscardingExporter()
+    create_exporter = tracing.create_exporter
+
+    runs: list[tuple[str, bool, float | None]] = [("tracing off", False, None)]
+    runs.append(("no-op tracer", True, None))
+    runs += [(f"ratio {ratio:g}", True, ratio) for ratio in args.ratios]
+
+    baseline = None
+    for name, enabled, ratio in runs:
+        settings.OTEL_ENABLED = enabled
+        if ratio is None:
+            tracing.create_exporter = create_exporter
+        else:
+            settings.OTEL_SAMPLE_RATIO = ratio
+            tracing.create_exporter = lambda _: exporter  # type: ignore[assignment]
+        exported_before = exporter.exported
+        latency = asyncio.run(per_request_us(args.requests, args.rounds))
+        baseline = baseline or latency
+        print(
+            f"{name:>13}: {latency:>8.1f} us/request  overhead {latency - baseline:>+7.1f} us"
+            f"  ({exporter.exported - exported_before} spans exported)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
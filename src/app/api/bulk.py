@@ -0,0 +1,186 @@
+import codecs
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from ..models import BulkBatch, BulkIngestResult, Item
+from ..repositories import ItemsBackend
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Upper bound on bytes buffered for a single, not yet complete, array element or line
+MAX_PENDING_CHARS = 1024 * 1024
+
+
+class JSONArrayParser:
+    """Incremental parser yielding the elements of a top-level JSON array as they arrive."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._expect_comma = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Consume a chunk of the body and return every element it completed.
+
+        Raises:
+            ValueError: If the body is not a JSON array
+        """
+        return self._consume(self._text.decode(chunk))
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the body.
+
+        Raises:
+            ValueError: If the array was malformed or not terminated
+        """
+        values = self._consume(self._text.decode(b"", final=True))
+        if not self._finished:
+            raise ValueError("Malformed or unterminated JSON array")
+        return values
+
+    def _consume(self, text: str) -> list[Any]:
+        self._buffer += text
+        values: list[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while not self._finished:
+            pos = _skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+            elif char == "]":
+                self._finished = True
+                pos += 1
+            elif self._expect_comma:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at offset {pos}")
+                self._expect_comma = False
+                pos += 1
+            else:
+                try:
+                    value, pos = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Most likely an element split across chunks; wait for more data
+                    break
+                values.append(value)
+                self._expect_comma = True
+
+        self._buffer = buffer[pos:]
+        if self._finished and self._buffer.strip():
+            raise ValueError("Unexpected data after JSON array")
+        if len(self._buffer) > MAX_PENDING_CHARS:
+            raise ValueError("Array element exceeds the maximum size")
+        return values
+
+
+class NDJSONParser:
+    """Incremental parser yielding one JSON value per newline-delimited line."""
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Consume a chunk of the body and return every line it completed.
+
+        Raises:
+            ValueError: If a line is not valid JSON
+        """
+        *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+        if len(self._buffer) > MAX_PENDING_CHARS:
+            raise ValueError("Line exceeds the maximum size")
+        return [_loads_line(line) for line in lines if line.strip()]
+
+    def close(self) -> list[Any]:
+        line, self._buffer = self._buffer, b""
+        return [_loads_line(line)] if line.strip() else []
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\n\r":
+        pos += 1
+    return pos
+
+
+def _loads_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON line: {e.msg}") from e
+
+
+async def iter_body_values(chunks: AsyncIterator[bytes], content_type: str) -> AsyncIterator[Any]:
+    """Yield decoded values from a streamed JSON array or NDJSON body."""
+    is_ndjson = content_type.split(";")[0].strip().lower() in NDJSON_CONTENT_TYPES
+    parser: JSONArrayParser | NDJSONParser = NDJSONParser() if is_ndjson else JSONArrayParser()
+    async for chunk in chunks:
+        for value in parser.feed(chunk):
+            yield value
+    for value in parser.close():
+        yield value
+
+
+async def ingest_items(
+    chunks: AsyncIterator[bytes],
+    content_type: str,
+    repo: ItemsBackend,
+    batch_size: int,
+) -> BulkIngestResult:
+    """
+    Validate items as they stream in and write them to ``repo`` in batches.
+
+    Only one batch is held in memory at a time. Batches already written stay
+    committed if a later item is rejected.
+
+    Raises:
+        HTTPException: 400 for a malformed body, 422 for an invalid item
+    """
+    result = BulkIngestResult(total=0, batches=[])
+    batch: list[Item] = []
+
+    async def flush() -> None:
+        created = await repo.add_items(batch)
+        ids = [item.id for item in created if item.id is not None]
+        result.batches.append(BulkBatch(count=len(ids), ids=ids))
+        result.total += len(ids)
+        batch.clear()
+
+    index = 0
+    try:
+        async for value in iter_body_values(chunks, content_type):
+            try:
+                batch.append(Item.model_validate(value))
+            except ValidationError as e:
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        "index": index,
+                        "errors": json.loads(e.json(include_url=False)),
+                        "committed": result.total,
+                    },
+                ) from e
+            index += 1
+            if len(batch) >= batch_size:
+                await flush()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail={"message": str(e), "committed": result.total}
+        ) from e
+
+    if batch:
+        await flush()
+    return result
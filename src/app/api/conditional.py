@@ -0,0 +1,101 @@
+"""
+Validators for item resources and evaluation of conditional request headers.
+
+ETags are derived from item ids and ``updated_at`` only, so they cost no
+serialization, and a 304 skips serializing the body at all.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TypeVar
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from starlette.datastructures import Headers
+
+from ..httputil import etag_matches, http_date, parse_http_date, strong_etag
+from ..models import Item
+from .responses import typed_response
+
+T = TypeVar("T")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None  # Aware, UTC
+
+    @property
+    def headers(self) -> dict[str, str]:
+        # Clients may keep the response but must revalidate before reusing it
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified)
+        return headers
+
+
+def _updated_at(item: Item) -> datetime:
+    # The in-memory store keeps Item's naive UTC defaults; Postgres returns aware values
+    updated_at = item.updated_at
+    return updated_at.replace(tzinfo=UTC) if updated_at.tzinfo is None else updated_at
+
+
+def _version(item: Item) -> str:
+    return f"{item.id}:{(_updated_at(item) - EPOCH) // timedelta(microseconds=1)}"
+
+
+def item_validators(item: Item) -> Validators:
+    return Validators(strong_etag(_version(item).encode()), _updated_at(item))
+
+
+def page_validators(items: list[Item]) -> Validators:
+    """Validators covering the page's membership and the version of every item on it."""
+    return Validators(
+        strong_etag(",".join(map(_version, items)).encode()),
+        max(map(_updated_at, items), default=None),
+    )
+
+
+def not_modified(headers: Headers, validators: Validators, *, use_dates: bool = True) -> bool:
+    """
+    Whether a GET can be answered with 304 Not Modified.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only consulted
+    without it, and only when ``use_dates`` (a list page's newest ``updated_at``
+    does not change when an item drops off the page, so lists rely on ETags).
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validators.etag)
+    if not use_dates or validators.last_modified is None:
+        return False
+    if_modified_since = parse_http_date(headers.get("if-modified-since"))
+    if if_modified_since is None:
+        return False
+    # HTTP dates have whole-second resolution
+    return validators.last_modified.replace(microsecond=0) <= if_modified_since
+
+
+def precondition_failed(headers: Headers, validators: Validators | None) -> bool:
+    """
+    Whether ``If-Match`` rules out changing the resource (412 Precondition Failed).
+
+    Tags are compared without their ``W/`` prefix: the version they identify is
+    the same whether or not the response carrying them was compressed.
+    """
+    if_match = headers.get("if-match")
+    if if_match is None:
+        return False
+    if validators is None:
+        return True
+    return not etag_matches(if_match, validators.etag)
+
+
+def validated_response(
+    value: T, adapter: TypeAdapter[T], response: Response, validators: Validators
+) -> T | Response:
+    """Return ``value`` carrying ``validators``, however it ends up serialized."""
+    response.headers.update(validators.headers)
+    return typed_response(value, adapter, validators.headers)
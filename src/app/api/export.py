@@ -0,0 +1,52 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from ..models import Item
+from ..repositories import ItemsBackend
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+CSV_COLUMNS = ("id", "name", "created_at", "updated_at")
+
+
+def _ndjson_rows(items: list[Item]) -> bytes:
+    return b"".join(item.model_dump_json().encode() + b"\n" for item in items)
+
+
+def _csv_rows(items: list[Item]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (item.id, item.name, item.created_at.isoformat(), item.updated_at.isoformat())
+        for item in items
+    )
+    return buffer.getvalue().encode()
+
+
+async def export_items(
+    repo: ItemsBackend, export_format: ExportFormat, chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Serialize every item in ``repo`` as NDJSON or CSV.
+
+    Rows are encoded and sent ``chunk_size`` at a time, so memory stays bounded
+    by one chunk and the first bytes go out as soon as the first rows are read.
+    """
+    encode = _csv_rows if export_format == "csv" else _ndjson_rows
+    if export_format == "csv":
+        yield (",".join(CSV_COLUMNS) + "\r\n").encode()
+
+    chunk: list[Item] = []
+    async for item in repo.iter_items(chunk_size):
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield encode(chunk)
+            chunk.clear()
+    if chunk:
+        yield encode(chunk)
@@ -1,20 +1,16 @@
-from typing import Annotated
+from typing import Any
 
-from asyncpg import Connection
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
+from fastapi.responses import Response
 from prometheus_client import Counter
-from sqlalchemy.exc import SQLAlchemyError
 
-from ..dependencies import get_db
+from ..db.health import health_prober
 
 router = APIRouter(tags=["health"])
 health_check_counter = Counter("health_check_total", "Total health check requests")
 
 # Define the return type for health check responses
-HealthResponse = dict[str, str]
-
-# Define dependency type annotation
-DBConnection = Annotated[Connection, Depends(get_db)]
+HealthResponse = dict[str, Any]
 
 
 @router.get("/health/live", response_model=HealthResponse)
@@ -24,11 +20,11 @@ async def liveness() -> HealthResponse:
 
 
 @router.get("/health/ready", response_model=HealthResponse)
-async def readiness(db: DBConnection) -> HealthResponse:
-    try:
-        # Check DB connection
-        await db.execute("SELECT 1")
-        return {"status": "ready"}
-    except SQLAlchemyError as e:
-        # Log the specific database error here if needed
-        return {"status": "not ready", "error": str(e)}
+async def readiness() -> Response:
+    """Report dependency health, with 503 while any is down so the instance leaves rotation."""
+    # Answered from the background prober's last result; no connection is opened here
+    return Response(
+        health_prober.report_body,
+        status_code=200 if health_prober.ready else 503,
+        media_type="application/json",
+    )
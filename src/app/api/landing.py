@@ -0,0 +1,68 @@
+import gzip
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from ..assets import static_url
+from ..config import settings
+from ..httputil import accepts_encoding, etag_matches, strong_etag
+
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+
+router = APIRouter()
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPage:
+    body: bytes
+    etag: str
+    gzip_body: bytes | None
+    gzip_etag: str
+
+
+@cache
+def get_templates() -> "Jinja2Templates":
+    # Jinja2 is only needed by the landing page, so it is not imported at startup
+    from fastapi.templating import Jinja2Templates
+
+    templates = Jinja2Templates(directory="src/app/templates")
+    templates.env.globals["static_url"] = static_url
+    return templates
+
+
+@cache
+def landing_page() -> RenderedPage:
+    """
+    Render ``index.html`` once; its only input is ``settings``, fixed for the process.
+
+    The gzip variant is kept only if it is actually smaller than the plain body.
+    """
+    body = get_templates().get_template("index.html").render(settings=settings).encode()
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    return RenderedPage(
+        body=body,
+        etag=strong_etag(body),
+        gzip_body=compressed if len(compressed) < len(body) else None,
+        gzip_etag=strong_etag(body, "gzip"),
+    )
+
+
+@router.get("/")
+async def root(request: Request) -> Response:
+    page = landing_page()
+    use_gzip = page.gzip_body is not None and accepts_encoding(
+        request.headers.get("accept-encoding"), "gzip"
+    )
+    etag = page.gzip_etag if use_gzip else page.etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if etag_matches(request.headers.get("if-none-match"), page.etag, page.gzip_etag):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(page.gzip_body, media_type="text/html", headers=headers)
+    return Response(page.body, media_type="text/html", headers=headers)
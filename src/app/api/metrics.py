@@ -0,0 +1,35 @@
+import os
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+from ..config import settings
+
+router = APIRouter(tags=["monitoring"])
+
+
+def is_multiprocess() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+@router.get(settings.METRICS_PATH, include_in_schema=False)
+def metrics() -> Response:
+    """
+    Expose Prometheus metrics.
+
+    When several workers share PROMETHEUS_MULTIPROC_DIR, every scrape aggregates
+    the samples all of them wrote there, whichever worker answers it.
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
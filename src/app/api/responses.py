@@ -0,0 +1,60 @@
+"""Response classes for the opt-in fast JSON path (FEATURE_FAST_JSON)."""
+
+from importlib.util import find_spec
+from typing import Any, TypeVar
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import TypeAdapter
+
+from ..config import settings
+
+T = TypeVar("T")
+
+# orjson is optional: ORJSONResponse needs it, JSONResponse is the fallback
+FAST_DEFAULT_RESPONSE: type[JSONResponse] = (
+    ORJSONResponse if find_spec("orjson") is not None else JSONResponse
+)
+
+
+class TypedJSONResponse(Response):
+    """
+    JSON response serialized by a pydantic ``TypeAdapter`` in one call.
+
+    Routes that return it skip FastAPI's ``response_model`` revalidation and
+    ``jsonable_encoder`` pass, so it is only for values the repository already
+    built as the declared type.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter[Any],
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.adapter = adapter
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: Any) -> bytes:
+        return self.adapter.dump_json(content)
+
+
+def typed_response(
+    value: T, adapter: TypeAdapter[T], headers: dict[str, str] | None = None
+) -> T | Response:
+    """
+    Return ``value`` pre-serialized when FEATURE_FAST_JSON is on, else as is.
+
+    ``headers`` only apply to the pre-serialized response; routes returning the
+    value itself set them on their injected ``Response`` as usual.
+    """
+    if settings.FEATURE_FAST_JSON:
+        return TypedJSONResponse(value, adapter, headers=headers)
+    return value
+
+
+def default_response_class() -> type[Response]:
+    """The app-wide response class for routes without a typed fast path."""
+    return FAST_DEFAULT_RESPONSE if settings.FEATURE_FAST_JSON else JSONResponse
@@ -1,80 +1,187 @@
+from datetime import UTC, datetime
+from typing import Annotated
+
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import APIKeyHeader
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 
+from ..auth import api_keys, digest, jwt_verifier
+from ..coalescing import WriteQueueFullError
 from ..config import settings
-from ..models import Item
+from ..models import BulkIngestResult, Item
+from ..repositories import create_items_repository, item_adapter, item_list_adapter
+from ..search import MIN_SUBSTRING_LENGTH, SearchMatch
+from .bulk import ingest_items
+from .conditional import (
+    item_validators,
+    not_modified,
+    page_validators,
+    precondition_failed,
+    validated_response,
+)
+from .export import EXPORT_MEDIA_TYPES, ExportFormat, export_items
+from .responses import typed_response
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/api/v1")
-api_key_header = APIKeyHeader(name="X-API-Key")
-
-
-class ItemsRepository:
-    def __init__(self) -> None:
-        self._items: list[Item] = []
-        self._current_id: int = 0
-
-    def add_item(self, item: Item) -> Item:
-        self._current_id += 1
-        item.id = self._current_id
-        self._items.append(item)
-        return item
-
-    def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]:
-        return self._items[skip : skip + limit]
-
-    def update_item(self, item_id: int, updated_item: Item) -> Item | None:
-        for idx, existing_item in enumerate(self._items):
-            if existing_item.id == item_id:
-                updated_item.id = item_id
-                self._items[idx] = updated_item
-                return updated_item
-        return None
-
-    def delete_item(self, item_id: int) -> bool:
-        for idx, item in enumerate(self._items):
-            if item.id == item_id:
-                self._items.pop(idx)
-                return True
-        return False
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+bearer_scheme = HTTPBearer(auto_error=False)
 
 
 # Create a single instance of the repository
-items_repo = ItemsRepository()
-
-
-def verify_api_key(api_key: str = Depends(api_key_header)) -> str:
-    if api_key != settings.API_KEY:
-        logger.error("invalid_api_key", key=api_key)
+items_repo = create_items_repository()
+
+
+async def authenticate(
+    api_key: Annotated[str | None, Depends(api_key_header)],
+    bearer: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+) -> str:
+    """
+    Accept an X-API-Key or, when a JWKS is configured, a JWT bearer token.
+
+    Returns:
+        str: The API key id or the token's subject
+    """
+    if bearer is not None and jwt_verifier.enabled:
+        claims = jwt_verifier.verify(bearer.credentials)
+        if claims is None:
+            logger.warning("invalid_bearer_token")
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid bearer token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return str(claims.get("sub", ""))
+    if api_key is None:
+        raise HTTPException(status_code=403, detail="Not authenticated")
+    key_id = await api_keys.verify(api_key)
+    if key_id is None:
+        # Never the key itself: without a registered "<id>." prefix it may all be secret
+        logger.warning(
+            "invalid_api_key",
+            key_id=api_keys.registered_id(api_key),
+            key_digest=digest(api_key).hex()[:8],
+        )
         raise HTTPException(status_code=403, detail="Invalid API key")
-    return api_key
+    return key_id
 
 
 @router.post("/items", response_model=Item)
-async def create_item(item: Item, _: str = Depends(verify_api_key)) -> Item:
-    return items_repo.add_item(item)
+async def create_item(item: Item, _: str = Depends(authenticate)) -> Item | Response:
+    try:
+        created = await items_repo.add_item(item)
+    except WriteQueueFullError as e:
+        logger.warning("items_write_queue_full", error=str(e))
+        raise HTTPException(
+            status_code=503, detail="Too many pending writes", headers={"Retry-After": "1"}
+        ) from e
+    return typed_response(created, item_adapter)
+
+
+@router.post("/items/bulk", response_model=BulkIngestResult)
+async def create_items_bulk(request: Request, _: str = Depends(authenticate)) -> BulkIngestResult:
+    """Ingest a JSON array or NDJSON stream of items in batches of ITEMS_BULK_BATCH_SIZE."""
+    return await ingest_items(
+        request.stream(),
+        request.headers.get("content-type", ""),
+        items_repo,
+        settings.ITEMS_BULK_BATCH_SIZE,
+    )
 
 
 @router.get("/items", response_model=list[Item])
 async def get_items(
-    skip: int = 0,
-    limit: int = 10,
-    _: str = Depends(verify_api_key),
-) -> list[Item]:
-    return items_repo.get_items(skip, limit)
+    request: Request,
+    response: Response,
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 10,
+    _: str = Depends(authenticate),
+) -> list[Item] | Response:
+    items = await items_repo.get_items(skip, limit)
+    validators = page_validators(items)
+    if not_modified(request.headers, validators, use_dates=False):
+        return Response(status_code=304, headers=validators.headers)
+    return validated_response(items, item_list_adapter, response, validators)
+
+
+@router.get("/items/export")
+async def export_all_items(
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    _: str = Depends(authenticate),
+) -> StreamingResponse:
+    """Stream the whole collection as NDJSON or CSV."""
+    return StreamingResponse(
+        export_items(items_repo, export_format, settings.ITEMS_EXPORT_CHUNK_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="items.{export_format}"'},
+    )
+
+
+@router.get("/items/search", response_model=list[Item])
+async def search_items(  # noqa: PLR0913 - query parameters
+    request: Request,
+    response: Response,
+    q: Annotated[str, Query(min_length=1, max_length=255)],
+    match: SearchMatch = "substring",
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 10,
+    _: str = Depends(authenticate),
+) -> list[Item] | Response:
+    """Find items whose name equals, starts with or contains ``q``, ordered by name then id."""
+    if match == "substring" and len(q) < MIN_SUBSTRING_LENGTH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Substring queries need at least {MIN_SUBSTRING_LENGTH} characters",
+        )
+    items = await items_repo.search_items(q, match, skip, limit)
+    validators = page_validators(items)
+    if not_modified(request.headers, validators, use_dates=False):
+        return Response(status_code=304, headers=validators.headers)
+    return validated_response(items, item_list_adapter, response, validators)
+
+
+@router.get("/items/{item_id}", response_model=Item)
+async def get_item(
+    item_id: int, request: Request, response: Response, _: str = Depends(authenticate)
+) -> Item | Response:
+    item = await items_repo.get_item(item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    validators = item_validators(item)
+    if not_modified(request.headers, validators):
+        return Response(status_code=304, headers=validators.headers)
+    return validated_response(item, item_adapter, response, validators)
 
 
 @router.put("/items/{item_id}", response_model=Item)
-async def update_item(item_id: int, item: Item, _: str = Depends(verify_api_key)) -> Item:
-    updated_item = items_repo.update_item(item_id, item)
+async def update_item(
+    item_id: int,
+    item: Item,
+    request: Request,
+    response: Response,
+    _: str = Depends(authenticate),
+) -> Item | Response:
+    """Replace an item; with ``If-Match`` only if it is still at the version the client saw."""
+    expected_updated_at = None
+    if "if-match" in request.headers:
+        current = await items_repo.get_item(item_id)
+        if precondition_failed(request.headers, item_validators(current) if current else None):
+            raise HTTPException(status_code=412, detail="Item has changed")
+        expected_updated_at = current.updated_at if current else None
+    # Stamped here so that every update yields new validators (naive UTC, like Item's defaults)
+    item.updated_at = datetime.now(UTC).replace(tzinfo=None)
+    updated_item = await items_repo.update_item(item_id, item, expected_updated_at)
     if not updated_item:
+        if expected_updated_at is not None:
+            # Changed (or deleted) between the If-Match check and the update
+            raise HTTPException(status_code=412, detail="Item has changed")
         raise HTTPException(status_code=404, detail="Item not found")
-    return updated_item
+    return validated_response(updated_item, item_adapter, response, item_validators(updated_item))
 
 
 @router.delete("/items/{item_id}")
-async def delete_item(item_id: int, _: str = Depends(verify_api_key)) -> dict[str, str]:
-    if not items_repo.delete_item(item_id):
+async def delete_item(item_id: int, _: str = Depends(authenticate)) -> dict[str, str]:
+    if not await items_repo.delete_item(item_id):
         raise HTTPException(status_code=404, detail="Item not found")
     return {"message": "Item deleted successfully"}
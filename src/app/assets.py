@@ -0,0 +1,176 @@
+"""
+Static asset pipeline: ``python -m src.app.assets`` builds STATIC_BUILD_DIR.
+
+Every file under STATIC_DIR is copied under its own name and under a content
+hashed name (``js/ItemsManager.3f2a9c1b7d.jsx``), with ``.br``/``.gz`` siblings
+for text assets when they are smaller. Hashed URLs never change content, so they
+are served ``immutable``; ``static_url()`` resolves them for templates.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import structlog
+from fastapi.staticfiles import StaticFiles
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+from .config import settings
+from .httputil import accepts_encoding
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz siblings are built
+    brotli = None
+
+logger = structlog.get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 10
+COMPRESSIBLE_SUFFIXES = {".css", ".html", ".js", ".json", ".jsx", ".map", ".svg", ".txt"}
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _compressors() -> dict[str, Callable[[bytes], bytes]]:
+    # Ordered by preference: the first encoding the client accepts is served
+    compressors: dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        compressors["br"] = lambda data: brotli.compress(data, quality=11)
+    compressors["gzip"] = lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    return compressors
+
+
+@dataclass(frozen=True)
+class Manifest:
+    assets: dict[str, str] = field(default_factory=dict)  # source path -> hashed path
+    encodings: dict[str, list[str]] = field(default_factory=dict)  # served path -> codings
+
+    @classmethod
+    def load(cls, directory: Path) -> "Manifest | None":
+        try:
+            data = json.loads((directory / MANIFEST_NAME).read_text())
+        except FileNotFoundError:
+            return None
+        return cls(assets=data["assets"], encodings=data["encodings"])
+
+
+def hashed_name(relative: str, data: bytes) -> str:
+    path = PurePosixPath(relative)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def build_assets(source: Path, target: Path) -> Manifest:
+    """
+    Rebuild ``target`` from ``source`` and write its manifest.
+
+    Returns:
+        Manifest: The hashed names and precompressed encodings that were written
+    """
+    if target.exists():
+        shutil.rmtree(target)
+    manifest = Manifest()
+    compressors = _compressors()
+
+    for file in sorted(path for path in source.rglob("*") if path.is_file()):
+        relative = file.relative_to(source).as_posix()
+        data = file.read_bytes()
+        hashed = hashed_name(relative, data)
+        manifest.assets[relative] = hashed
+
+        for name in (relative, hashed):
+            destination = target / name
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(data)
+            if file.suffix not in COMPRESSIBLE_SUFFIXES:
+                continue
+            for coding, compress in compressors.items():
+                compressed = compress(data)
+                if len(compressed) < len(data):
+                    Path(f"{destination}{ENCODING_SUFFIXES[coding]}").write_bytes(compressed)
+                    manifest.encodings.setdefault(name, []).append(coding)
+
+    (target / MANIFEST_NAME).write_text(
+        json.dumps({"assets": manifest.assets, "encodings": manifest.encodings}, indent=2)
+    )
+    return manifest
+
+
+@cache
+def current_manifest() -> Manifest | None:
+    return Manifest.load(Path(settings.STATIC_BUILD_DIR))
+
+
+def static_url(path: str) -> str:
+    """Resolve a STATIC_DIR-relative path to its hashed URL once assets are built."""
+    manifest = current_manifest()
+    if manifest is not None:
+        path = manifest.assets.get(path, path)
+    return f"/static/{path}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles over a built asset directory.
+
+    Serves the ``.br``/``.gz`` sibling the client accepts, and marks hashed names
+    ``immutable`` while original names are revalidated on every use.
+    """
+
+    def __init__(self, *, manifest: Manifest, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.manifest = manifest
+        self._immutable = set(manifest.assets.values())
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        encodings = self.manifest.encodings.get(path, [])
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        coding = next((c for c in encodings if accepts_encoding(accept_encoding, c)), None)
+
+        if coding is None:
+            response = await super().get_response(path, scope)
+        else:
+            response = await super().get_response(path + ENCODING_SUFFIXES[coding], scope)
+            response.headers["Content-Encoding"] = coding
+            if response.status_code == status.HTTP_200_OK:
+                response.headers["Content-Type"] = content_type(path)
+
+        if encodings:
+            response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMMUTABLE if path in self._immutable else "no-cache"
+        return response
+
+
+def content_type(path: str) -> str:
+    media_type = mimetypes.guess_type(path)[0] or "text/plain"
+    return f"{media_type}; charset=utf-8" if media_type.startswith("text/") else media_type
+
+
+def static_files() -> StaticFiles:
+    """The /static app: built assets when STATIC_BUILD_DIR has a manifest, else STATIC_DIR."""
+    manifest = current_manifest()
+    if manifest is None:
+        return StaticFiles(directory=settings.STATIC_DIR)
+    return PrecompressedStaticFiles(directory=settings.STATIC_BUILD_DIR, manifest=manifest)
+
+
+if __name__ == "__main__":
+    built = build_assets(Path(settings.STATIC_DIR), Path(settings.STATIC_BUILD_DIR))
+    logger.info(
+        "static_assets_built",
+        target=settings.STATIC_BUILD_DIR,
+        assets=len(built.assets),
+        precompressed=sum(len(codings) for codings in built.encodings.values()),
+        brotli=brotli is not None,
+    )
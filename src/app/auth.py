@@ -0,0 +1,306 @@
+"""
+Client authentication: bcrypt-hashed API keys and JWT bearer tokens.
+
+API keys are issued as ``<key_id>.<secret>``; the registry (API_KEYS_FILE, a
+JSON object of key id to bcrypt hash) is looked up by id, so checking a key
+costs at most one bcrypt verification. Bearer tokens are RS256/ES256 JWTs
+checked against a JWKS (JWT_JWKS inline or JWT_JWKS_FILE) whose keys are
+parsed once per change.
+
+Both keep results in a bounded LRU keyed by the credential's SHA-256 digest,
+so repeated calls skip bcrypt or signature verification. Their files are
+re-read when they change, checked at most every *_RELOAD_INTERVAL seconds,
+and a reload clears the cache, so revoking a key takes effect within that
+interval.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+import jwt
+import structlog
+from passlib.context import CryptContext
+from prometheus_client import Counter
+
+from .config import Settings, settings
+
+logger = structlog.get_logger(__name__)
+
+credential_checks = Counter(
+    "auth_credential_checks_total",
+    "Credential checks by scheme and verification cache result",
+    ["scheme", "cache"],
+)
+
+key_context = CryptContext(schemes=["bcrypt"])
+
+V = TypeVar("V")
+
+
+class VerifiedCache(Generic[V]):
+    """LRU of verification results keyed by credential digest, each with its own expiry."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: bytes, now: float) -> tuple[V] | None:
+        """Return the cached result as a 1-tuple, or None on a miss."""
+        entry = self._entries.pop(digest, None)
+        if entry is None or entry[1] <= now:
+            return None
+        self._entries[digest] = entry
+        return (entry[0],)
+
+    def put(self, digest: bytes, value: V, expires_at: float) -> None:
+        self._entries[digest] = (value, expires_at)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class WatchedFile:
+    """Read a file again when it changes, checking at most every ``interval`` seconds."""
+
+    def __init__(self, path: str, interval: float) -> None:
+        self.path = Path(path)
+        self._interval = interval
+        self._check_at = 0.0
+        self._signature: tuple[int, int, int] | None = None
+
+    def read_if_changed(self, now: float) -> str | None:
+        if now < self._check_at:
+            return None
+        self._check_at = now + self._interval
+        try:
+            stat = self.path.stat()
+            # Inode too: secret volumes are updated by swapping in a new file
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature == self._signature:
+                return None
+            text = self.path.read_text()
+        except OSError as e:
+            # Callers keep the last good contents rather than locking everyone out
+            logger.error("auth_file_unreadable", path=str(self.path), error=str(e))
+            return None
+        self._signature = signature
+        return text
+
+
+def digest(credential: str) -> bytes:
+    return hashlib.sha256(credential.encode()).digest()
+
+
+class ApiKeyRegistry:
+    """Verify API keys against the hashed registry through a TTL/LRU cache."""
+
+    def __init__(self, config: Settings = settings) -> None:
+        self._file = (
+            WatchedFile(config.API_KEYS_FILE, config.API_KEY_RELOAD_INTERVAL)
+            if config.API_KEYS_FILE
+            else None
+        )
+        # The single plaintext key of older deployments, compared in constant time
+        self._legacy_key = config.API_KEY.encode() if config.API_KEY else None
+        self._ttl = config.API_KEY_CACHE_TTL
+        self._hashes: dict[str, str] = {}
+        # Rejections are cached too, so a repeated bad key does not cost bcrypt each time
+        self._cache: VerifiedCache[str | None] = VerifiedCache(config.API_KEY_CACHE_SIZE)
+        self._inflight: dict[bytes, asyncio.Task[str | None]] = {}
+
+    async def verify(self, api_key: str) -> str | None:
+        """
+        Check ``api_key`` and return the id it was issued under.
+
+        Returns:
+            str | None: The key id (``"default"`` for API_KEY), or None if invalid
+        """
+        now = time.monotonic()
+        self._reload_if_changed(now)
+        key_digest = digest(api_key)
+
+        if cached := self._cache.get(key_digest, now):
+            credential_checks.labels(scheme="api_key", cache="hit").inc()
+            return cached[0]
+        credential_checks.labels(scheme="api_key", cache="miss").inc()
+
+        # Concurrent checks of the same uncached key share one bcrypt call
+        task = self._inflight.get(key_digest)
+        if task is None:
+            task = asyncio.create_task(self._check_and_cache(key_digest, api_key))
+            self._inflight[key_digest] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key_digest, None))
+        return await asyncio.shield(task)
+
+    def registered_id(self, api_key: str) -> str | None:
+        """Return the id part of ``api_key`` if it names a registered key, valid or not."""
+        key_id, dot, _ = api_key.partition(".")
+        return key_id if dot and key_id in self._hashes else None
+
+    def verified_id(self, api_key: str) -> str | None:
+        """
+        Return the id of ``api_key`` if it was recently verified, without checking it.
+
+        Cheap enough to call before authentication, as the rate limiter does.
+        """
+        cached = self._cache.get(digest(api_key), time.monotonic())
+        return cached[0] if cached else None
+
+    async def _check_and_cache(self, key_digest: bytes, api_key: str) -> str | None:
+        key_id = await self._check(api_key)
+        self._cache.put(key_digest, key_id, time.monotonic() + self._ttl)
+        return key_id
+
+    async def _check(self, api_key: str) -> str | None:
+        if self._legacy_key is not None and hmac.compare_digest(api_key.encode(), self._legacy_key):
+            return "default"
+        key_id, _, secret = api_key.partition(".")
+        hashed = self._hashes.get(key_id)
+        if hashed is None or not secret:
+            return None
+        # bcrypt is deliberately slow; keep it off the event loop
+        if await asyncio.to_thread(key_context.verify, secret, hashed):
+            return key_id
+        return None
+
+    def _reload_if_changed(self, now: float) -> None:
+        if self._file is None or (text := self._file.read_if_changed(now)) is None:
+            return
+        try:
+            hashes = json.loads(text)
+        except ValueError as e:
+            logger.error("api_keys_invalid", path=str(self._file.path), error=str(e))
+            return
+        self._hashes = {str(key_id): str(hashed) for key_id, hashed in hashes.items()}
+        self._cache.clear()
+        logger.info("api_keys_loaded", path=str(self._file.path), keys=len(self._hashes))
+
+
+class JwtVerifier:
+    """
+    Verify bearer tokens against a JWKS, caching parsed keys and verified claims.
+
+    A verified token is trusted for JWT_CACHE_TTL seconds or until it expires,
+    whichever comes first.
+    """
+
+    def __init__(self, config: Settings = settings) -> None:
+        self._file = (
+            WatchedFile(config.JWT_JWKS_FILE, config.JWT_JWKS_RELOAD_INTERVAL)
+            if config.JWT_JWKS_FILE
+            else None
+        )
+        self._algorithms = set(config.JWT_ALGORITHMS)
+        # .env files leave these as "" when unset, which PyJWT would demand as the claim
+        self._audience = config.JWT_AUDIENCE or None
+        self._issuer = config.JWT_ISSUER or None
+        self._leeway = config.JWT_LEEWAY
+        self._ttl = config.JWT_CACHE_TTL
+        self._keys: dict[str | None, jwt.PyJWK] = {}
+        self._cache: VerifiedCache[dict[str, Any]] = VerifiedCache(config.JWT_CACHE_SIZE)
+        if config.JWT_JWKS:
+            self._load(config.JWT_JWKS, "JWT_JWKS")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._keys) or self._file is not None
+
+    def verify(self, token: str) -> dict[str, Any] | None:
+        """
+        Check ``token``'s signature and claims.
+
+        Returns:
+            dict[str, Any] | None: The token's claims, or None if it is invalid
+        """
+        now = time.monotonic()
+        if self._file is not None and (text := self._file.read_if_changed(now)) is not None:
+            self._load(text, str(self._file.path))
+        token_digest = digest(token)
+
+        if cached := self._cache.get(token_digest, now):
+            credential_checks.labels(scheme="jwt", cache="hit").inc()
+            return cached[0]
+        credential_checks.labels(scheme="jwt", cache="miss").inc()
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            # Tokens without a kid are accepted when the set holds a single key
+            key = self._keys.get(kid) or (
+                next(iter(self._keys.values())) if kid is None and len(self._keys) == 1 else None
+            )
+            if key is None:
+                return None
+            claims: dict[str, Any] = jwt.decode(
+                token,
+                key.key,
+                algorithms=[key.algorithm_name],
+                audience=self._audience,
+                issuer=self._issuer,
+                leeway=self._leeway,
+                options={"require": ["exp"]},
+            )
+        except jwt.PyJWTError:
+            return None
+
+        remaining = claims["exp"] + self._leeway - time.time()
+        self._cache.put(token_digest, claims, now + min(self._ttl, remaining))
+        return claims
+
+    def verified_digest(self, token: str) -> bytes | None:
+        """
+        Return ``token``'s digest if it was recently verified, without checking it.
+
+        Cheap enough to call before authentication, as the rate limiter does.
+        """
+        token_digest = digest(token)
+        return token_digest if self._cache.get(token_digest, time.monotonic()) else None
+
+    def _load(self, text: str, source: str) -> None:
+        try:
+            jwks = jwt.PyJWKSet.from_json(text)
+        except (jwt.PyJWKSetError, ValueError) as e:
+            logger.error("jwks_invalid", source=source, error=str(e))
+            return
+        keys = {key.key_id: key for key in jwks.keys if key.algorithm_name in self._algorithms}
+        if len(keys) < len(jwks.keys):
+            logger.warning("jwks_keys_skipped", source=source, allowed=sorted(self._algorithms))
+        self._keys = keys
+        self._cache.clear()
+        logger.info("jwks_loaded", source=source, keys=len(keys))
+
+
+def issue_key(key_id: str) -> tuple[str, str]:
+    """
+    Generate a key for ``key_id``.
+
+    Returns:
+        tuple[str, str]: The key to hand to the client and the hash to store
+    """
+    if not key_id or "." in key_id:
+        raise ValueError(f"Invalid key id {key_id!r}: it must be non-empty, without '.'")
+    secret = secrets.token_urlsafe(32)
+    return f"{key_id}.{secret}", key_context.hash(secret)
+
+
+api_keys = ApiKeyRegistry()
+jwt_verifier = JwtVerifier()
+
+
+if __name__ == "__main__":
+    # python -m src.app.auth <key_id>: print a new key and its registry entry
+    key, hashed = issue_key(sys.argv[1] if len(sys.argv) > 1 else "client")
+    key_id = key.partition(".")[0]
+    sys.stdout.write(f"key:   {key}\nentry: {json.dumps({key_id: hashed})}\n")
@@ -0,0 +1,130 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+import structlog
+from prometheus_client import Counter
+from redis.asyncio.client import Redis
+from redis.exceptions import RedisError
+
+from .config import Settings, settings
+from .db.redis_pool import RedisPool, redis_pool
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+logger = structlog.get_logger(__name__)
+
+cache_hits = Counter("cache_hits_total", "Cache lookups served from Redis", ["namespace", "kind"])
+cache_misses = Counter(
+    "cache_misses_total", "Cache lookups that hit the backend", ["namespace", "kind"]
+)
+cache_errors = Counter("cache_errors_total", "Redis errors while using the cache", ["namespace"])
+
+# Reads the namespace version and the versioned entry in a single round trip.
+# A missing entry truncates the returned table, leaving only the version.
+LOOKUP_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return {version, redis.call('GET', ARGV[1] .. version .. ':' .. ARGV[2])}
+"""
+
+Loader = Callable[[], Awaitable[bytes]]
+
+
+class VersionedCache:
+    """
+    Read-through Redis cache whose entries are keyed by a namespace version.
+
+    Bumping the version with ``invalidate`` atomically orphans every entry of the
+    namespace; orphans simply expire with their TTL. Concurrent misses for the same
+    key are collapsed within the process and, across processes, only the holder of
+    a short Redis lock reloads while the others wait for its result.
+    """
+
+    def __init__(self, namespace: str, pool: RedisPool = redis_pool, config: Settings = settings):
+        self._namespace = namespace
+        self._pool = pool
+        self._ttl = config.CACHE_TTL
+        self._lock_timeout = config.CACHE_LOCK_TIMEOUT_MS / 1000
+        self._version_key = f"cache:{namespace}:version"
+        self._entry_prefix = f"cache:{namespace}:v"
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self._lookup: AsyncScript | None = None
+
+    async def get_or_load(self, kind: str, key: str, loader: Loader) -> bytes:
+        """
+        Return the cached bytes for ``key``, calling ``loader`` on a miss.
+
+        Redis failures are logged and fall back to ``loader``.
+        """
+        try:
+            client = self._pool.client
+            if self._lookup is None:
+                self._lookup = client.register_script(LOOKUP_SCRIPT)
+            result = await self._lookup(
+                keys=[self._version_key], args=[self._entry_prefix, key], client=client
+            )
+        except (RedisError, RuntimeError) as e:
+            self._record_error(e)
+            return await loader()
+
+        version = result[0].decode()
+        cached = result[1] if len(result) > 1 else None
+        if cached is not None:
+            cache_hits.labels(namespace=self._namespace, kind=kind).inc()
+            return bytes(cached)
+
+        cache_misses.labels(namespace=self._namespace, kind=kind).inc()
+        entry_key = f"{self._entry_prefix}{version}:{key}"
+        task = self._inflight.get(entry_key)
+        if task is None:
+            task = asyncio.create_task(self._fill(client, entry_key, loader))
+            self._inflight[entry_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(entry_key, None))
+        return await asyncio.shield(task)
+
+    async def invalidate(self) -> None:
+        """Orphan every entry in the namespace by bumping its version."""
+        try:
+            await self._pool.client.incr(self._version_key)
+        except (RedisError, RuntimeError) as e:
+            self._record_error(e)
+
+    async def _fill(self, client: Redis, entry_key: str, loader: Loader) -> bytes:
+        lock_key = f"{entry_key}:lock"
+        try:
+            acquired = await client.set(lock_key, b"1", nx=True, px=int(self._lock_timeout * 1000))
+            if not acquired and (cached := await self._wait_for(client, entry_key)):
+                return cached
+        except RedisError as e:
+            self._record_error(e)
+            return await loader()
+
+        value = await loader()
+        # Jitter the TTL so entries filled together do not all expire together
+        ttl = self._ttl + random.randint(0, max(1, self._ttl // 10))  # noqa: S311  # nosec B311
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(entry_key, value, ex=ttl)
+                pipe.delete(lock_key)
+                await pipe.execute()
+        except RedisError as e:
+            self._record_error(e)
+        return value
+
+    async def _wait_for(self, client: Redis, entry_key: str) -> bytes | None:
+        deadline = time.monotonic() + self._lock_timeout
+        delay = 0.005
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            cached: bytes | None = await client.get(entry_key)
+            if cached is not None:
+                return cached
+            delay = min(delay * 2, 0.1)
+        return None
+
+    def _record_error(self, error: Exception) -> None:
+        cache_errors.labels(namespace=self._namespace).inc()
+        logger.warning("cache_unavailable", namespace=self._namespace, error=str(error))
@@ -0,0 +1,192 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+
+from .config import Settings, settings
+from .models import Item
+
+logger = structlog.get_logger(__name__)
+
+write_batch_size = Histogram(
+    "items_write_batch_size",
+    "Item creates written per coalesced batch",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+write_flush_duration = Histogram(
+    "items_write_flush_duration_seconds",
+    "Time taken to write one coalesced batch of item creates",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+write_queue_depth = Gauge(
+    "items_write_queue_depth",
+    "Item creates waiting to be written",
+    multiprocess_mode="livesum",
+)
+write_rejections = Counter(
+    "items_write_rejected_total",
+    "Item creates rejected because the write queue stayed full",
+)
+
+BatchWriter = Callable[[list[Item]], Awaitable[list[Item]]]
+Pending = tuple[Item, asyncio.Future[Item]]
+
+
+WRITER_STOPPED = "The item writer stopped before this create was written"
+
+# Errors caused by one row's data; anything else (a lost connection, a timeout) fails every row
+ROW_ERRORS = (asyncpg.DataError, asyncpg.IntegrityConstraintViolationError)
+
+
+class WriteQueueFullError(Exception):
+    """The write queue stayed full for ITEMS_WRITE_QUEUE_TIMEOUT seconds."""
+
+
+class WriteCoalescer:
+    """
+    Gathers concurrent item creates and writes them with one ``write`` call per batch.
+
+    A batch is written once it holds ITEMS_WRITE_BATCH_SIZE items or its first
+    item has waited ITEMS_WRITE_MAX_DELAY_MS, whichever comes first. A single
+    writer task flushes batches one after another, so creates hold at most one
+    connection; while it writes, the next batch fills up. Creates wait for room
+    in a queue of ITEMS_WRITE_QUEUE_SIZE for up to ITEMS_WRITE_QUEUE_TIMEOUT
+    seconds before they are rejected with WriteQueueFullError.
+
+    If the database rejects a row in a batch, the batch's items are written again
+    one at a time so that row fails only its own create. Any other failure fails
+    the whole batch at once.
+    """
+
+    def __init__(self, write: BatchWriter, config: Settings = settings) -> None:
+        self._write = write
+        self._max_batch = config.ITEMS_WRITE_BATCH_SIZE
+        self._max_delay = config.ITEMS_WRITE_MAX_DELAY_MS / 1000
+        self._queue_size = config.ITEMS_WRITE_QUEUE_SIZE
+        self._enqueue_timeout = config.ITEMS_WRITE_QUEUE_TIMEOUT
+        self._queue: asyncio.Queue[Pending | None] | None = None
+        self._batch_ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit(self, item: Item) -> Item:
+        """
+        Queue ``item`` for the next batch and wait until it has been written.
+
+        Raises:
+            WriteQueueFullError: If no room was freed in the queue in time
+        """
+        queue = self._start()
+        future: asyncio.Future[Item] = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((item, future))
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(queue.put((item, future)), self._enqueue_timeout)
+            except TimeoutError as e:
+                write_rejections.inc()
+                raise WriteQueueFullError(f"{queue.qsize()} item creates already queued") from e
+        write_queue_depth.inc()
+        if queue.qsize() >= self._max_batch:
+            self._batch_ready.set()
+        return await future
+
+    async def close(self) -> None:
+        """Write everything queued so far and stop the writer task."""
+        if self._task is None or self._queue is None:
+            return
+        task, queue = self._task, self._queue
+        self._task = self._queue = None
+        if not task.done():
+            await queue.put(None)
+            self._batch_ready.set()
+            await task
+
+    def _start(self) -> asyncio.Queue[Pending | None]:
+        # Restarted after close(), or when the loop that ran the last writer is gone
+        if self._queue is None or self._task is None or self._task.done():
+            self._queue = asyncio.Queue(self._queue_size)
+            self._batch_ready = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._queue), name="items-write-coalescer")
+            queue = self._queue
+            # Also run when the task is cancelled before it starts, so no caller hangs
+            self._task.add_done_callback(lambda _: fail_queued(queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[Pending | None]) -> None:
+        closing = False
+        batch: list[Pending] = []
+        try:
+            # After close()'s sentinel, whatever is still queued is written without waiting
+            while not closing or not queue.empty():
+                first = await queue.get()
+                if first is None:
+                    closing = True
+                    continue
+                if not closing and queue.qsize() + 1 < self._max_batch and self._max_delay > 0:
+                    # Event.wait is safe to time out, unlike Queue.get which can lose an item
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._batch_ready.wait(), self._max_delay)
+                self._batch_ready.clear()
+
+                batch = [first]
+                while len(batch) < self._max_batch and not queue.empty():
+                    pending = queue.get_nowait()
+                    if pending is None:
+                        closing = True
+                    else:
+                        batch.append(pending)
+                write_queue_depth.dec(len(batch))
+                await self._flush(batch)
+                batch = []
+        finally:
+            # Only left with a batch if the writer was cancelled or broke mid-write
+            fail(batch, RuntimeError(WRITER_STOPPED))
+
+    async def _flush(self, batch: list[Pending]) -> None:
+        # Callers that gave up (e.g. the client disconnected) are not written
+        batch = [(item, future) for item, future in batch if not future.cancelled()]
+        if not batch:
+            return
+        write_batch_size.observe(len(batch))
+        start = time.perf_counter()
+        try:
+            created = await self._write([item for item, _ in batch])
+        except Exception as e:  # noqa: BLE001 - handed to the callers
+            logger.error("items_write_batch_failed", size=len(batch), error=str(e))
+            if len(batch) == 1 or not isinstance(e, ROW_ERRORS):
+                fail(batch, e)
+                return
+            # One bad row fails the whole statement; write them singly so it fails alone
+            for pending in batch:
+                await self._flush([pending])
+            return
+        finally:
+            write_flush_duration.observe(time.perf_counter() - start)
+
+        if len(created) != len(batch):
+            # Not retried: the rows may well have been written
+            logger.error("items_write_count_mismatch", size=len(batch), written=len(created))
+            fail(batch, RuntimeError(f"Wrote {len(created)} rows for {len(batch)} creates"))
+            return
+        for (_, future), item in zip(batch, created, strict=True):
+            if not future.done():
+                future.set_result(item)
+
+
+def fail_queued(queue: asyncio.Queue[Pending | None]) -> None:
+    batch = []
+    while not queue.empty():
+        if (pending := queue.get_nowait()) is not None:
+            write_queue_depth.dec()
+            batch.append(pending)
+    fail(batch, RuntimeError(WRITER_STOPPED))
+
+
+def fail(batch: list[Pending], error: BaseException) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
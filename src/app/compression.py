@@ -0,0 +1,117 @@
+"""
+Incremental response encoders for CompressionMiddleware.
+
+gzip always works; brotli (``br``) and zstd are offered only when the optional
+``brotli`` / ``zstandard`` packages are installed.
+"""
+
+import zlib
+from collections.abc import Callable, Mapping
+from typing import Protocol
+
+from .httputil import accepts_encoding
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+# Content that is already compressed gains nothing from another pass
+INCOMPRESSIBLE_PREFIXES = ("image/", "audio/", "video/", "font/woff")
+INCOMPRESSIBLE_TYPES = {
+    "application/gzip",
+    "application/octet-stream",
+    "application/x-brotli",
+    "application/x-gzip",
+    "application/zip",
+    "application/zstd",
+}
+COMPRESSIBLE_EXCEPTIONS = {"image/svg+xml"}
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Feed ``data``; may return nothing until more input or a flush arrives."""
+
+    def flush(self) -> bytes:
+        """Emit everything fed so far while keeping the stream open."""
+
+    def finish(self) -> bytes:
+        """Emit the remaining output and end the stream."""
+
+
+class GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+class ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH))
+
+
+# Server preference, best ratio per CPU first
+ENCODERS: dict[str, Callable[[int], Encoder]] = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+ENCODERS["gzip"] = GzipEncoder
+
+
+def negotiate(accept_encoding: str | None, levels: Mapping[str, int]) -> str | None:
+    """Pick the preferred available coding that the client accepts and has a level."""
+    return next(
+        (
+            coding
+            for coding in ENCODERS
+            if coding in levels and accepts_encoding(accept_encoding, coding)
+        ),
+        None,
+    )
+
+
+def is_compressible(content_type: str | None) -> bool:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in COMPRESSIBLE_EXCEPTIONS:
+        return True
+    return media_type not in INCOMPRESSIBLE_TYPES and not media_type.startswith(
+        INCOMPRESSIBLE_PREFIXES
+    )
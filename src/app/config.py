@@ -62,12 +62,62 @@ class Settings(BaseSettings):
     APP_HOST: str = get_default_host()
     APP_PORT: int = 8080
     APP_LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "console"  # console or json
+    LOG_QUEUE_SIZE: int = 10000  # Events beyond this are dropped and counted, never blocked on
+    # Share of successful requests logged; 4xx/5xx and slow requests are always logged
+    LOG_ACCESS_SAMPLE_RATE: float = 1.0
+    LOG_SLOW_REQUEST_MS: float = 1000.0
+
+    # Production server (python -m src.app.server)
+    SERVER_WORKERS: int = 0  # 0 sizes the pool from the container CPU limit
+    SERVER_MAX_REQUESTS: int = 0  # Recycle a worker after this many requests, 0 never
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_KEEPALIVE_TIMEOUT: int = 5
 
     # API Security
-    API_KEY: str = "dev-secret-key"
+    API_KEY: str = "dev-secret-key"  # Single plaintext key; empty disables it
+    API_KEYS_FILE: str | None = None  # JSON object of key id -> bcrypt hash
+    API_KEY_CACHE_TTL: float = 60.0  # Seconds a verified (or rejected) key is remembered
+    API_KEY_CACHE_SIZE: int = 10000
+    API_KEY_RELOAD_INTERVAL: float = 10.0  # Upper bound on how long a revoked key keeps working
+
+    # JWT bearer tokens, accepted when a JWKS is configured
+    JWT_JWKS: str | None = None  # Inline JWKS JSON
+    JWT_JWKS_FILE: str | None = None
+    JWT_JWKS_RELOAD_INTERVAL: float = 60.0
+    JWT_ALGORITHMS: list[str] = ["RS256", "ES256"]
+    JWT_AUDIENCE: str | None = None
+    JWT_ISSUER: str | None = None
+    JWT_LEEWAY: float = 30.0  # Seconds of clock skew tolerated for exp/nbf/iat
+    JWT_CACHE_TTL: float = 30.0  # Seconds a verified token skips signature checks (capped by exp)
+    JWT_CACHE_SIZE: int = 10000
     API_RATE_LIMIT: str = "100/minute"
+    RATE_LIMIT_ENABLED: bool = True
     API_TIMEOUT: int = 30
 
+    # Response compression (br and zstd need the optional brotli/zstandard packages)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Item storage backend: "memory" (per process) or "postgres" (shared)
+    ITEMS_BACKEND: str = "memory"
+    ITEMS_BULK_BATCH_SIZE: int = 1000
+    ITEMS_EXPORT_CHUNK_SIZE: int = 500
+    # Coalesce concurrent creates into multi-row inserts (Postgres backend only)
+    ITEMS_WRITE_COALESCING_ENABLED: bool = False
+    ITEMS_WRITE_BATCH_SIZE: int = 100
+    ITEMS_WRITE_MAX_DELAY_MS: float = 5.0
+    ITEMS_WRITE_QUEUE_SIZE: int = 10000
+    ITEMS_WRITE_QUEUE_TIMEOUT: float = 1.0
+
+    # Static assets; python -m src.app.assets builds hashed, precompressed copies
+    STATIC_DIR: str = "src/app/static"
+    STATIC_BUILD_DIR: str = "src/app/static_dist"
+
     #######################################
     # Database Configuration
     #######################################
@@ -77,6 +127,7 @@ class Settings(BaseSettings):
     DB_HOST: str = "postgres"
     DB_PORT: int = 5432
     DB_SSL_MODE: str = "disable"
+    DB_MIN_CONNECTIONS: int = 0
     DB_MAX_CONNECTIONS: int = 100
     DB_IDLE_TIMEOUT: int = 300
     DB_CONNECT_TIMEOUT: int = 10
@@ -91,6 +142,11 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_SSL: bool = False
     REDIS_TIMEOUT: int = 5
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # Read-through cache (FEATURE_CACHE_ENABLED)
+    CACHE_TTL: int = 60
+    CACHE_LOCK_TIMEOUT_MS: int = 2000
     REDIS_URL: str | None = None
 
     #######################################
@@ -126,6 +182,19 @@ class Settings(BaseSettings):
     METRICS_PORT: int = 9090
     METRICS_PATH: str = "/metrics"
 
+    # OpenTelemetry FastAPI instrumentation
+    OTEL_ENABLED: bool = True
+    OTEL_EXPORTER: str = "none"  # none (no-op tracer), console or otlp
+    OTEL_SAMPLE_RATIO: float = 0.1  # Share of new traces sampled; children follow their parent
+    OTEL_BSP_MAX_QUEUE_SIZE: int = 2048  # Spans beyond this are dropped, not blocked on
+    OTEL_BSP_SCHEDULE_DELAY: int = 5000  # Milliseconds between batch exports
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE: int = 512
+    OTEL_EXCLUDED_URLS: str = "/health/,/static/"  # Comma-separated patterns, never traced
+
+    # Background dependency checks answering /health/ready
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+
     GRAFANA_USER: str = "admin"
     GRAFANA_PASSWORD: str = "admin"
     GRAFANA_PORT: int = 3000
@@ -153,6 +222,8 @@ class Settings(BaseSettings):
     FEATURE_ASYNC_TASKS: bool = True
     FEATURE_CACHE_ENABLED: bool = True
     FEATURE_API_DOCS: bool = True
+    # Serialize item responses with TypeAdapter.dump_json (and other JSON with orjson)
+    FEATURE_FAST_JSON: bool = False
 
     class Config:
         env_file = find_env_file()
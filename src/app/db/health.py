@@ -0,0 +1,129 @@
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from prometheus_client import Gauge, Histogram
+
+from ..config import Settings, settings
+from .pool import DatabasePool, db_pool
+from .redis_pool import RedisPool, redis_pool
+
+logger = structlog.get_logger(__name__)
+
+dependency_up = Gauge(
+    "dependency_up",
+    "Whether the last background check of a dependency succeeded",
+    ["dependency"],
+    multiprocess_mode="livemin",
+)
+dependency_check_duration = Histogram(
+    "dependency_check_duration_seconds",
+    "Latency of background dependency checks",
+    ["dependency"],
+)
+
+Check = Callable[[], Awaitable[Any]]
+
+
+class HealthProber:
+    """
+    Checks Postgres and Redis every HEALTH_CHECK_INTERVAL seconds in the background.
+
+    Readiness probes read the cached ``report`` instead of opening connections, so
+    probe traffic never reaches the dependencies.
+    """
+
+    def __init__(
+        self,
+        database: DatabasePool = db_pool,
+        redis: RedisPool = redis_pool,
+        config: Settings = settings,
+    ) -> None:
+        self._database = database
+        self._redis = redis
+        self._interval = config.HEALTH_CHECK_INTERVAL
+        self._timeout = config.HEALTH_CHECK_TIMEOUT
+        self._task: asyncio.Task[None] | None = None
+        self.report: dict[str, Any] = {
+            "status": "not ready",
+            "checks": {"database": False, "redis": False, "api": True},
+            "details": {},
+        }
+        self.report_body = json.dumps(self.report).encode()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.report["status"] == "ready")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-prober")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def probe(self) -> dict[str, Any]:
+        """Run every check once, concurrently, and publish the new report."""
+        database, redis = await asyncio.gather(
+            self._check("database", self._ping_database),
+            self._check("redis", self._ping_redis),
+        )
+        details = {"database": database, "redis": redis}
+        checks = {name: detail["status"] == "up" for name, detail in details.items()}
+        self.report = {
+            "status": "ready" if all(checks.values()) else "not ready",
+            "checks": {**checks, "api": True},
+            "details": details,
+        }
+        # Serialized once per cycle so that readiness probes only copy bytes
+        self.report_body = json.dumps(self.report).encode()
+        return self.report
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self._interval)
+
+    async def _check(self, name: str, check: Check) -> dict[str, Any]:
+        start_time = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(check(), timeout=self._timeout)
+        except Exception as e:  # noqa: BLE001 - any failure means the dependency is down
+            error = str(e) or type(e).__name__
+        latency = time.perf_counter() - start_time
+
+        dependency_check_duration.labels(dependency=name).observe(latency)
+        dependency_up.labels(dependency=name).set(error is None)
+        if error is not None and self.report["checks"].get(name):
+            logger.warning("dependency_down", dependency=name, error=error)
+
+        detail: dict[str, Any] = {
+            "status": "up" if error is None else "down",
+            "latency_ms": round(latency * 1000, 3),
+            "checked_at": datetime.now(UTC).isoformat(),
+        }
+        if error is not None:
+            detail["error"] = error
+        return detail
+
+    async def _ping_database(self) -> None:
+        async with self._database.connection() as conn:
+            await conn.execute("SELECT 1")
+
+    async def _ping_redis(self) -> None:
+        await self._redis.client.ping()
+
+
+# Create a single instance of the prober
+health_prober = HealthProber()
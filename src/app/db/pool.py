@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+import structlog
+from asyncpg import Connection
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..config import Settings, settings
+
+logger = structlog.get_logger(__name__)
+
+pool_size = Gauge(
+    "db_pool_size",
+    "Number of connections currently held by the pool",
+    multiprocess_mode="livesum",
+)
+pool_idle = Gauge(
+    "db_pool_idle_connections",
+    "Number of idle connections in the pool",
+    multiprocess_mode="livesum",
+)
+pool_acquire_duration = Histogram(
+    "db_pool_acquire_duration_seconds",
+    "Time spent waiting to acquire a pooled database connection",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+pool_acquire_timeouts = Counter(
+    "db_pool_acquire_timeouts_total",
+    "Number of connection acquisitions that timed out",
+)
+
+
+class DatabasePool:
+    """Process-wide asyncpg connection pool opened and closed by the app lifespan."""
+
+    def __init__(self, config: Settings = settings) -> None:
+        self._settings = config
+        self._pool: asyncpg.Pool | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._pool is not None
+
+    async def open(self) -> None:
+        """
+        Create the underlying pool.
+
+        Connections are established lazily up to ``DB_MIN_CONNECTIONS`` so that the
+        application can start while Postgres is still coming up.
+        """
+        if self._pool is not None:
+            return
+
+        self._pool = await asyncpg.create_pool(
+            self._settings.DATABASE_URL,
+            min_size=self._settings.DB_MIN_CONNECTIONS,
+            max_size=self._settings.DB_MAX_CONNECTIONS,
+            max_inactive_connection_lifetime=self._settings.DB_IDLE_TIMEOUT,
+            timeout=self._settings.DB_CONNECT_TIMEOUT,
+        )
+        self._update_gauges()
+        logger.info(
+            "db_pool_opened",
+            min_size=self._settings.DB_MIN_CONNECTIONS,
+            max_size=self._settings.DB_MAX_CONNECTIONS,
+        )
+
+    async def close(self) -> None:
+        """Close all pooled connections, waiting for in-flight ones to be released."""
+        if self._pool is None:
+            return
+
+        await self._pool.close()
+        self._pool = None
+        pool_size.set(0)
+        pool_idle.set(0)
+        logger.info("db_pool_closed")
+
+    async def acquire(self) -> Connection:
+        """
+        Borrow a connection from the pool; it must be handed back with ``release``.
+
+        Raises:
+            RuntimeError: If the pool has not been opened
+            asyncio.TimeoutError: If no connection became available within DB_CONNECT_TIMEOUT
+        """
+        if self._pool is None:
+            raise RuntimeError("Database pool is not open")
+
+        start_time = time.perf_counter()
+        try:
+            return await self._pool.acquire(timeout=self._settings.DB_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            pool_acquire_timeouts.inc()
+            logger.warning("db_pool_acquire_timeout", timeout=self._settings.DB_CONNECT_TIMEOUT)
+            raise
+        finally:
+            pool_acquire_duration.observe(time.perf_counter() - start_time)
+            self._update_gauges()
+
+    async def release(self, conn: Connection) -> None:
+        """Return a connection obtained from ``acquire`` to the pool."""
+        if self._pool is None:
+            await conn.close()
+            return
+        await self._pool.release(conn)
+        self._update_gauges()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Connection]:
+        """Borrow a connection for the duration of the context."""
+        conn = await self.acquire()
+        try:
+            yield conn
+        finally:
+            await self.release(conn)
+
+    def _update_gauges(self) -> None:
+        if self._pool is None:
+            return
+        pool_size.set(self._pool.get_size())
+        pool_idle.set(self._pool.get_idle_size())
+
+
+# Create a single instance of the pool
+db_pool = DatabasePool()
@@ -0,0 +1,117 @@
+from typing import Any
+
+import structlog
+from prometheus_client import Gauge
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.connection import AbstractConnection, SSLConnection
+
+from ..config import Settings, settings
+
+logger = structlog.get_logger(__name__)
+
+pool_in_use = Gauge(
+    "redis_pool_connections_in_use",
+    "Redis connections currently checked out",
+    multiprocess_mode="livesum",
+)
+pool_idle = Gauge(
+    "redis_pool_connections_idle",
+    "Redis connections idle in the pool",
+    multiprocess_mode="livesum",
+)
+pool_max = Gauge(
+    "redis_pool_max_connections",
+    "Maximum number of Redis connections in the pool",
+    multiprocess_mode="livesum",
+)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """Blocking connection pool that publishes its utilization after every checkout."""
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        connection: AbstractConnection = await super().get_connection(*args, **kwargs)
+        self.observe()
+        return connection
+
+    async def release(self, connection: AbstractConnection) -> None:
+        await super().release(connection)
+        self.observe()
+
+    def observe(self) -> None:
+        # redis-py keeps no public counters, so read the pool's own bookkeeping
+        pool_in_use.set(len(self._in_use_connections))  # type: ignore[attr-defined]
+        pool_idle.set(len(self._available_connections))  # type: ignore[attr-defined]
+
+
+class RedisPool:
+    """Process-wide Redis connection pool and client opened and closed by the app lifespan."""
+
+    def __init__(self, config: Settings = settings) -> None:
+        self._settings = config
+        self._pool: InstrumentedConnectionPool | None = None
+        self._client: Redis | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    @property
+    def client(self) -> Redis:
+        """
+        Shared client bound to the pool; obtaining it performs no I/O.
+
+        Raises:
+            RuntimeError: If the pool has not been opened
+        """
+        if self._client is None:
+            raise RuntimeError("Redis pool is not open")
+        return self._client
+
+    def open(self) -> None:
+        """
+        Create the pool and shared client.
+
+        Connections are established on first use, so this never touches the network.
+
+        Raises:
+            ValueError: If REDIS_URL is not set
+        """
+        if self._client is not None:
+            return
+        if self._settings.REDIS_URL is None:
+            raise ValueError("REDIS_URL must be set")
+
+        options: dict[str, Any] = {}
+        if self._settings.REDIS_SSL:
+            options["connection_class"] = SSLConnection
+
+        self._pool = InstrumentedConnectionPool.from_url(
+            self._settings.REDIS_URL,
+            max_connections=self._settings.REDIS_MAX_CONNECTIONS,
+            timeout=self._settings.REDIS_TIMEOUT,
+            socket_timeout=self._settings.REDIS_TIMEOUT,
+            socket_connect_timeout=self._settings.REDIS_TIMEOUT,
+            **options,
+        )
+        self._client = Redis(connection_pool=self._pool)
+        pool_max.set(self._settings.REDIS_MAX_CONNECTIONS)
+        self._pool.observe()
+        logger.info("redis_pool_opened", max_connections=self._settings.REDIS_MAX_CONNECTIONS)
+
+    async def close(self) -> None:
+        """Drop the shared client and disconnect every pooled connection."""
+        if self._pool is None:
+            return
+
+        pool = self._pool
+        self._client = None
+        self._pool = None
+        await pool.disconnect()
+        pool_in_use.set(0)
+        pool_idle.set(0)
+        logger.info("redis_pool_closed")
+
+
+# Create a single instance of the pool
+redis_pool = RedisPool()
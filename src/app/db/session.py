@@ -1,5 +1,7 @@
 import os
 from collections.abc import AsyncGenerator
+from functools import cache
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base
@@ -20,15 +22,24 @@ def get_database_url() -> str:
     return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
 
 
-# Create async engine instance
-async_engine: AsyncEngine = create_async_engine(
-    get_database_url(),
-    echo=bool(os.getenv("APP_DEBUG", "false").lower() == "true"),
-)
+@cache
+def get_engine() -> AsyncEngine:
+    """Create the async engine on first use rather than at import time."""
+    return create_async_engine(
+        get_database_url(),
+        echo=bool(os.getenv("APP_DEBUG", "false").lower() == "true"),
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps ``from .session import async_engine`` working without eager creation
+    if name == "async_engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Async session factory with correct return type hint
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Create and yield an async database session."""
-    async with AsyncSession(async_engine) as session:
+    async with AsyncSession(get_engine()) as session:
         yield session
@@ -1,48 +1,48 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from typing import Any
 
-import redis.asyncio as redis
 from asyncpg import Connection as AsyncPGConnection
+from fastapi import HTTPException
 from redis.asyncio.client import Redis
 
 from .config import Settings, settings
+from .db.pool import db_pool
+from .db.redis_pool import redis_pool
 
 
 async def get_db() -> AsyncGenerator[AsyncPGConnection, None]:
     """
-    Create and yield a database connection.
+    Borrow a database connection from the application pool.
 
     Returns:
-        AsyncGenerator[AsyncPGConnection, None]: Database connection
+        AsyncGenerator[AsyncPGConnection, None]: Pooled database connection
 
     Raises:
+        HTTPException: 503 if no connection could be acquired in time
         asyncpg.exceptions.PostgresError: If connection fails
     """
-    conn = await AsyncPGConnection.connect(settings.DATABASE_URL)
+    try:
+        conn = await db_pool.acquire()
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=503, detail="Database unavailable") from e
+
     try:
         yield conn
     finally:
-        await conn.close()
+        await db_pool.release(conn)
 
 
-async def get_redis() -> AsyncGenerator[Redis[Any], None]:
+async def get_redis() -> AsyncGenerator[Redis, None]:
     """
-    Create and yield a Redis connection.
+    Yield the shared Redis client backed by the application connection pool.
 
     Returns:
-        AsyncGenerator[Redis, None]: Redis connection
+        AsyncGenerator[Redis, None]: Redis client
 
     Raises:
-        redis.exceptions.RedisError: If connection fails
+        RuntimeError: If the Redis pool has not been opened
     """
-    if settings.REDIS_URL is None:
-        raise ValueError("REDIS_URL must be set")
-
-    redis_client = redis.from_url(settings.REDIS_URL)
-    try:
-        yield redis_client
-    finally:
-        await redis_client.close()
+    yield redis_pool.client
 
 
 def get_settings() -> Settings:
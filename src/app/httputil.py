@@ -0,0 +1,63 @@
+"""Small helpers for conditional requests and content negotiation."""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+def strong_etag(body: bytes, suffix: str = "") -> str:
+    """Return a quoted strong ETag derived from ``body``, e.g. ``"3f2a...-gzip"``."""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f'"{digest}{"-" + suffix if suffix else ""}"'
+
+
+def etag_matches(if_none_match: str | None, *etags: str) -> bool:
+    """
+    Evaluate ``If-None-Match`` against the current ETags of a resource.
+
+    Uses the weak comparison RFC 9110 prescribes for this header, so ``W/"x"``
+    matches ``"x"``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag.removeprefix("W/") in candidates for etag in etags)
+
+
+def http_date(value: datetime) -> str:
+    """Format ``value`` as an IMF-fixdate; naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return format_datetime(value.astimezone(UTC), usegmt=True)
+
+
+def parse_http_date(value: str | None) -> datetime | None:
+    """Parse an HTTP date header into an aware datetime, or None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def accepts_encoding(accept_encoding: str | None, coding: str) -> bool:
+    """Whether an ``Accept-Encoding`` header allows ``coding`` (explicitly or via ``*``)."""
+    if not accept_encoding:
+        return False
+    allowed: dict[str, bool] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        allowed[name.strip()] = quality > 0
+    return allowed.get(coding, allowed.get("*", False))
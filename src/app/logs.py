@@ -0,0 +1,154 @@
+"""
+structlog configuration with rendering and I/O off the event loop.
+
+Loggers only build the event dict on the calling thread; a writer thread fed by a
+bounded queue renders and writes it. When the queue is full the event is dropped
+and counted in ``log_events_dropped_total`` instead of blocking the caller.
+"""
+
+import logging
+import queue
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, TextIO
+
+import structlog
+from prometheus_client import Counter
+from structlog.typing import EventDict, Processor
+
+from .config import Settings, settings
+
+log_events_dropped = Counter(
+    "log_events_dropped_total",
+    "Log events dropped because the log queue was full",
+    ["level"],
+)
+
+
+class QueueSink:
+    """Render and write event dicts on a background thread."""
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        processors: Iterable[Processor] = (),
+        maxsize: int = 10_000,
+    ) -> None:
+        self.stream = stream or sys.stdout
+        self._processors = list(processors) or [structlog.processors.JSONRenderer()]
+        self._queue: queue.Queue[EventDict | None] = queue.Queue(maxsize)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, event_dict: EventDict) -> None:
+        if self._closed:
+            self._write([event_dict])
+            return
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            log_events_dropped.labels(level=event_dict.get("level", "unknown")).inc()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Everything already queued goes out in the same write and flush
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            self._write(event for event in batch if event is not None)
+
+    def _write(self, events: Iterable[EventDict]) -> None:
+        lines = []
+        for event_dict in events:
+            rendered: Any = event_dict
+            try:
+                for processor in self._processors:
+                    rendered = processor(None, event_dict.get("level", "info"), rendered)
+            except Exception:  # noqa: BLE001 - a bad event must not stop the writer
+                rendered = repr(event_dict)
+            lines.append(f"{rendered}\n")
+        if lines:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+
+
+class QueueLogger:
+    """structlog logger that hands the processed event dict to a :class:`QueueSink`."""
+
+    def __init__(self, sink: QueueSink) -> None:
+        self._sink = sink
+
+    def msg(self, event_dict: EventDict) -> None:
+        self._sink.put(event_dict)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+def _capture_exc_info(_logger: Any, _method_name: str, event_dict: EventDict) -> EventDict:
+    # sys.exc_info() is per thread, so it is resolved before the event is queued
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _to_sink(_logger: Any, _method_name: str, event_dict: EventDict) -> tuple[Any, ...]:
+    # Final processor: passes the dict itself, unrendered, as the logger's argument
+    return (event_dict,), {}
+
+
+def configure_logging(config: Settings = settings, stream: TextIO | None = None) -> QueueSink:
+    """
+    Route structlog through a new :class:`QueueSink` and return it.
+
+    Events below APP_LOG_LEVEL are filtered where they are logged. Only the
+    cheap processors (context, level, timestamp) run on the calling thread;
+    exception formatting and the LOG_FORMAT renderer run on the writer thread.
+
+    Returns:
+        QueueSink: The sink; close it on shutdown to flush queued events
+    """
+    renderer: Callable[..., Any] = (
+        structlog.processors.JSONRenderer()
+        if config.LOG_FORMAT == "json"
+        else structlog.dev.ConsoleRenderer(colors=False)
+    )
+    sink = QueueSink(
+        stream,
+        processors=[structlog.processors.format_exc_info, renderer],
+        maxsize=config.LOG_QUEUE_SIZE,
+    )
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            _capture_exc_info,
+            _to_sink,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(config.APP_LOG_LEVEL.upper())
+        ),
+        logger_factory=lambda *_: QueueLogger(sink),
+        # Each call installs a new sink; cached loggers would keep writing to the old one
+        cache_logger_on_first_use=False,
+    )
+    return sink
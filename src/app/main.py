@@ -1,24 +1,84 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import structlog
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from opentelemetry import trace
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from prometheus_client import multiprocess
 
-from .api import health, views
+from .api import health, landing, metrics, views
+from .api.responses import default_response_class
+from .assets import static_files
+from .auth import api_keys, jwt_verifier
 from .config import settings
-from .middleware import LoggingMiddleware, MetricsMiddleware
+from .db.health import health_prober
+from .db.pool import db_pool
+from .db.redis_pool import redis_pool
+from .logs import configure_logging
+from .middleware import (
+    CompressionMiddleware,
+    LoggingMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+)
+from .ratelimit import Rate, RateLimiter
+from .repositories import CoalescingItemsRepository
 
 logger = structlog.get_logger(__name__)
-tracer = trace.get_tracer(__name__)
-templates = Jinja2Templates(directory="src/app/templates")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    log_sink = configure_logging()
+    await db_pool.open()
+    redis_pool.open()
+    health_prober.start()
+    try:
+        yield
+    finally:
+        await health_prober.stop()
+        if isinstance(views.items_repo, CoalescingItemsRepository):
+            # Queued creates need the pools one last time
+            await views.items_repo.close()
+        await redis_pool.close()
+        await db_pool.close()
+        if tracer_provider := getattr(app.state, "tracer_provider", None):
+            # Flushes spans still waiting in the batch processor
+            tracer_provider.shutdown()
+        if metrics.is_multiprocess():
+            multiprocess.mark_process_dead(os.getpid())
+        log_sink.close()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, debug=settings.APP_DEBUG)
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        debug=settings.APP_DEBUG,
+        lifespan=lifespan,
+        default_response_class=default_response_class(),
+    )
 
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            levels={
+                "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+                "br": settings.COMPRESSION_BROTLI_QUALITY,
+                "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            },
+        )
+    if settings.RATE_LIMIT_ENABLED:
+        # Added before CORS so that it runs inside it: 429s carry CORS headers and
+        # preflight requests are answered without spending quota
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=RateLimiter(Rate.parse(settings.API_RATE_LIMIT)),
+            keys=api_keys,
+            tokens=jwt_verifier,
+        )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ALLOWED_ORIGINS,
@@ -27,18 +87,25 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(MetricsMiddleware)
-    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(
+        LoggingMiddleware,
+        sample_rate=settings.LOG_ACCESS_SAMPLE_RATE,
+        slow_threshold=settings.LOG_SLOW_REQUEST_MS / 1000,
+    )
 
-    app.mount("/static", StaticFiles(directory="src/app/static"), name="static")
+    app.mount("/static", static_files(), name="static")
 
+    app.include_router(landing.router)
     app.include_router(health.router)
     app.include_router(views.router)
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics.router)
 
-    FastAPIInstrumentor.instrument_app(app)
+    if settings.OTEL_ENABLED:
+        # Imported here: the instrumentation packages are slow to import
+        from .tracing import instrument_app
 
-    @app.get("/")
-    async def root(request: Request) -> HTMLResponse:
-        return templates.TemplateResponse("index.html", {"request": request, "settings": settings})
+        app.state.tracer_provider = instrument_app(app)
 
     return app
 
@@ -46,8 +113,15 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
+    if settings.APP_ENVIRONMENT == "production":
+        from .server import run
+
+        sys.exit(run())
+
     uvicorn.run(
         "main:app",
         host=settings.APP_HOST,
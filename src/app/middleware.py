@@ -1,62 +1,263 @@
+import random
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Mapping
 
 import structlog
-from fastapi import Request
-from fastapi.responses import Response
 from prometheus_client import Histogram
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette import status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .auth import ApiKeyRegistry, JwtVerifier
+from .compression import ENCODERS, Encoder, is_compressible, negotiate
+from .ratelimit import RateLimiter, client_key
 
 logger = structlog.get_logger(__name__)
 
 request_duration = Histogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
-    ["method", "endpoint"],
+    ["method", "endpoint", "status_class"],
 )
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
+def route_template(scope: Scope) -> str:
+    """
+    Return the path template that handled the request, e.g. ``/api/v1/items/{item_id}``.
+
+    Labelling by template rather than raw path keeps metric cardinality bounded.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return str(route.path)
+    # Mounted apps (e.g. /static) extend root_path by the prefix they matched
+    root_path = scope.get("root_path", "")
+    app_root_path = scope.get("app_root_path", root_path)
+    if root_path != app_root_path:
+        return f"{root_path[len(app_root_path):]}/{{path}}"
+    return "<unmatched>"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            request_duration.labels(
+                method=scope["method"],
+                endpoint=route_template(scope),
+                status_class=f"{status_code // 100}xx",
+            ).observe(duration)
+
+
+class LoggingMiddleware:
+    """
+    Log one ``request_completed`` event per request, carrying its duration.
 
-        request_duration.labels(method=request.method, endpoint=request.url.path).observe(duration)
+    Successful responses are logged at ``sample_rate``; 4xx/5xx responses,
+    failures and requests slower than ``slow_threshold`` seconds always are.
+    """
 
-        return response
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_threshold: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+        method = scope["method"]
+        path = scope["path"]
         # Safely get client IP, defaulting to None if not available
-        client_ip = request.client.host if request.client else None
+        client = scope.get("client")
+        client_ip = client[0] if client else None
 
-        logger.info(
-            "request_started",
-            method=request.method,
-            path=request.url.path,
-            client_ip=client_ip,
-        )
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-            logger.info(
-                "request_completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-            )
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.error(
                 "request_failed",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
+                client_ip=client_ip,
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
                 error=str(e),
             )
             raise
+
+        duration = time.perf_counter() - start_time
+        if self._sampled_out(status_code, duration):
+            return
+        logger.info(
+            "request_completed",
+            method=method,
+            path=path,
+            status_code=status_code,
+            client_ip=client_ip,
+            duration_ms=round(duration * 1000, 3),
+        )
+
+    def _sampled_out(self, status_code: int, duration: float) -> bool:
+        if status_code >= status.HTTP_400_BAD_REQUEST or duration >= self.slow_threshold:
+            return False
+        if self.sample_rate >= 1:
+            return False
+        return random.random() >= self.sample_rate  # noqa: S311  # nosec B311
+
+
+class RateLimitMiddleware:
+    """
+    Limit API requests per verified API key or bearer token, or per client IP otherwise.
+
+    Requests whose credential is not in its verifier's cache (none, a wrong one, or
+    one not yet checked) count against their IP, so guessing keys is limited before
+    it costs a bcrypt verification.
+    """
+
+    def __init__(  # noqa: PLR0913 - middleware options
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        keys: ApiKeyRegistry,
+        tokens: JwtVerifier,
+        path_prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.keys = keys
+        self.tokens = tokens
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        api_key = request_headers.get("x-api-key")
+        scheme, _, token = request_headers.get("authorization", "").partition(" ")
+        key_id = self.keys.verified_id(api_key) if api_key else None
+        token_digest = self.tokens.verified_digest(token) if scheme.lower() == "bearer" else None
+        client = scope.get("client")
+        result = await self.limiter.hit(
+            client_key(key_id, client[0] if client else None, token_digest)
+        )
+        headers = result.headers()
+
+        if not result.allowed:
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"}, status_code=429, headers=headers
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best coding the client accepts (zstd, br, gzip).
+
+    Complete bodies under ``minimum_size`` and responses that are already encoded
+    or of an incompressible type pass through untouched. Streaming responses are
+    compressed chunk by chunk and flushed after each one, so nothing is buffered.
+    """
+
+    def __init__(self, app: ASGIApp, levels: Mapping[str, int], minimum_size: int = 1024) -> None:
+        self.app = app
+        self.levels = {coding: level for coding, level in levels.items() if coding in ENCODERS}
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        coding = None
+        if scope["type"] == "http":
+            coding = negotiate(Headers(scope=scope).get("accept-encoding"), self.levels)
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        encoder: Encoder | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk decides the headers
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                headers = MutableHeaders(scope=start_message)
+                if (
+                    (not more_body and len(body) < self.minimum_size)
+                    or "content-encoding" in headers
+                    # A range's offsets refer to the unencoded representation
+                    or "content-range" in headers
+                    or start_message["status"] in (204, 206, 304)
+                    or not is_compressible(headers.get("content-type"))
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = ENCODERS[coding](self.levels[coding])
+                headers["Content-Encoding"] = coding
+                headers.add_vary_header("Accept-Encoding")
+                if etag := headers.get("etag"):
+                    # The encoded bytes differ, so a strong validator would be wrong
+                    headers["ETag"] = etag if etag.startswith("W/") else f"W/{etag}"
+                del headers["Content-Length"]
+                if not more_body:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+
+            chunk = encoder.compress(body)
+            chunk += encoder.flush() if more_body else encoder.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
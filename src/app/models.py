@@ -5,9 +5,20 @@ from pydantic import BaseModel, Field
 
 class Item(BaseModel):
     id: int | None = None
-    name: str
+    # items.name is VARCHAR(255); longer names are rejected here rather than by Postgres
+    name: str = Field(max_length=255)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
         from_attributes = True
+
+
+class BulkBatch(BaseModel):
+    count: int
+    ids: list[int]
+
+
+class BulkIngestResult(BaseModel):
+    total: int
+    batches: list[BulkBatch]
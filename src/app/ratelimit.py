@@ -0,0 +1,185 @@
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import structlog
+from prometheus_client import Counter
+from redis.exceptions import RedisError
+
+from .db.redis_pool import RedisPool, redis_pool
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+logger = structlog.get_logger(__name__)
+
+rate_limited_requests = Counter(
+    "rate_limited_requests_total", "Requests rejected by the rate limiter", ["backend"]
+)
+rate_limit_fallbacks = Counter(
+    "rate_limit_fallbacks_total", "Times the limiter fell back to the in-process bucket"
+)
+
+RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$", re.IGNORECASE)
+UNIT_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Sliding-window counter: the previous fixed window is weighted by how much of it
+# still overlaps the sliding window. Time comes from Redis so that every replica
+# agrees on window boundaries. Returns {allowed, remaining, reset_ms}.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local index = math.floor(now / window)
+local elapsed = now - index * window
+local current_key = KEYS[1] .. ':' .. index
+local current = tonumber(redis.call('GET', current_key) or '0')
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (index - 1)) or '0')
+local used = math.floor(previous * (window - elapsed) / window) + current
+if used >= limit then
+    return {0, 0, window - elapsed}
+end
+redis.call('INCR', current_key)
+redis.call('PEXPIRE', current_key, window * 2)
+return {1, limit - used - 1, window - elapsed}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Rate:
+    limit: int
+    window: int  # seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "Rate":
+        """
+        Parse a rate such as ``100/minute``.
+
+        Raises:
+            ValueError: If the value is not ``<count>/<second|minute|hour|day>``
+        """
+        match = RATE_PATTERN.match(value)
+        if not match:
+            raise ValueError(f"Invalid rate limit: {value!r}")
+        return cls(limit=int(match.group(1)), window=UNIT_SECONDS[match.group(2).lower()])
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # seconds until the limit frees up
+
+    def headers(self) -> dict[str, str]:
+        reset = str(max(1, math.ceil(self.reset_after)))
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": reset,
+        }
+        if not self.allowed:
+            headers["Retry-After"] = reset
+        return headers
+
+
+class TokenBucketLimiter:
+    """In-process token buckets, one per key, holding at most ``max_keys`` buckets."""
+
+    def __init__(self, rate: Rate, max_keys: int = 10_000) -> None:
+        self._rate = rate
+        self._refill_per_second = rate.limit / rate.window
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def hit(self, key: str) -> RateLimitResult:
+        now = time.monotonic()
+        capacity = float(self._rate.limit)
+        tokens, updated_at = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * self._refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+
+        missing = (1 - tokens) if not allowed else (capacity - tokens)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self._rate.limit,
+            remaining=int(tokens),
+            reset_after=missing / self._refill_per_second,
+        )
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter shared through Redis, one script call per request.
+
+    If Redis fails, the limiter switches to in-process token buckets (enforcing
+    the limit per worker) and retries Redis after ``retry_after`` seconds, so an
+    outage costs one timeout rather than one per request.
+    """
+
+    def __init__(self, rate: Rate, pool: RedisPool = redis_pool, retry_after: float = 5.0):
+        self.rate = rate
+        self._pool = pool
+        self._retry_after = retry_after
+        self._redis_retry_at = 0.0
+        self._script: AsyncScript | None = None
+        self._fallback = TokenBucketLimiter(rate)
+
+    async def hit(self, key: str) -> RateLimitResult:
+        """Count one request for ``key`` and report whether it is allowed."""
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                result = await self._hit_redis(key)
+            except (RedisError, RuntimeError) as e:
+                self._redis_retry_at = time.monotonic() + self._retry_after
+                rate_limit_fallbacks.inc()
+                logger.warning("rate_limit_redis_unavailable", error=str(e))
+            else:
+                if not result.allowed:
+                    rate_limited_requests.labels(backend="redis").inc()
+                return result
+
+        result = self._fallback.hit(key)
+        if not result.allowed:
+            rate_limited_requests.labels(backend="local").inc()
+        return result
+
+    async def _hit_redis(self, key: str) -> RateLimitResult:
+        client = self._pool.client
+        if self._script is None:
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        allowed, remaining, reset_ms = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[self.rate.limit, self.rate.window * 1000],
+            client=client,
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=self.rate.limit,
+            remaining=int(remaining),
+            reset_after=int(reset_ms) / 1000,
+        )
+
+
+def client_key(key_id: str | None, client_ip: str | None, token_digest: bytes | None = None) -> str:
+    """
+    Identify the caller by its verified API key id or bearer token, or else by its IP.
+
+    Only a credential already verified may get a bucket of its own: keyed on anything
+    the client sends unchecked, a fresh made-up one per request would never be limited.
+    """
+    if key_id:
+        return f"key:{key_id}"
+    if token_digest:
+        return f"token:{token_digest.hex()[:32]}"
+    return f"ip:{client_ip or 'unknown'}"
@@ -0,0 +1,395 @@
+import hashlib
+import threading
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Protocol
+
+from asyncpg import Record
+from pydantic import TypeAdapter
+
+from .cache import VersionedCache
+from .coalescing import WriteCoalescer
+from .config import Settings, settings
+from .db.pool import DatabasePool, db_pool
+from .models import Item
+from .search import NameIndex, SearchMatch, SortedList
+
+item_adapter: TypeAdapter[Item] = TypeAdapter(Item)
+item_or_none_adapter: TypeAdapter[Item | None] = TypeAdapter(Item | None)
+item_list_adapter: TypeAdapter[list[Item]] = TypeAdapter(list[Item])
+
+
+class ItemsBackend(Protocol):
+    async def add_item(self, item: Item) -> Item: ...
+
+    async def add_items(self, items: list[Item]) -> list[Item]: ...
+
+    async def get_item(self, item_id: int) -> Item | None: ...
+
+    async def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]: ...
+
+    async def search_items(
+        self, query: str, match: SearchMatch, skip: int = 0, limit: int = 10
+    ) -> list[Item]: ...
+
+    def iter_items(self, batch_size: int = 500) -> AsyncIterator[Item]: ...
+
+    async def update_item(
+        self, item_id: int, updated_item: Item, expected_updated_at: datetime | None = None
+    ) -> Item | None: ...
+
+    async def delete_item(self, item_id: int) -> bool: ...
+
+
+class ItemsRepository:
+    """Per-process in-memory item store."""
+
+    def __init__(self) -> None:
+        self._items: dict[int, Item] = {}
+        # Ids only grow, so id order is the listing order; pages are found by position
+        self._ids: SortedList[int] = SortedList()
+        self._names = NameIndex()
+        self._current_id: int = 0
+        self._lock = threading.Lock()
+
+    async def add_item(self, item: Item) -> Item:
+        with self._lock:
+            self._current_id += 1
+            item.id = self._current_id
+            self._items[item.id] = item
+            self._ids.add(item.id)
+            self._names.add(item.name, item.id)
+        return item
+
+    async def add_items(self, items: list[Item]) -> list[Item]:
+        with self._lock:
+            for item in items:
+                self._current_id += 1
+                item.id = self._current_id
+                self._items[item.id] = item
+                self._ids.add(item.id)
+                self._names.add(item.name, item.id)
+        return list(items)
+
+    async def get_item(self, item_id: int) -> Item | None:
+        return self._items.get(item_id)
+
+    async def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]:
+        with self._lock:
+            return [self._items[item_id] for item_id in self._ids.at(skip, skip + limit)]
+
+    async def search_items(
+        self, query: str, match: SearchMatch, skip: int = 0, limit: int = 10
+    ) -> list[Item]:
+        with self._lock:
+            ids = self._names.search(query, match, skip + limit)[skip:]
+            return [self._items[item_id] for item_id in ids]
+
+    async def iter_items(self, batch_size: int = 500) -> AsyncIterator[Item]:  # noqa: ARG002
+        # Snapshot references only, so writers can keep mutating the index meanwhile
+        for item in list(self._items.values()):
+            yield item
+
+    async def update_item(
+        self, item_id: int, updated_item: Item, expected_updated_at: datetime | None = None
+    ) -> Item | None:
+        with self._lock:
+            current = self._items.get(item_id)
+            if current is None:
+                return None
+            if expected_updated_at is not None and current.updated_at != expected_updated_at:
+                return None
+            updated_item.id = item_id
+            self._items[item_id] = updated_item
+            if updated_item.name != current.name:
+                self._names.remove(item_id)
+                self._names.add(updated_item.name, item_id)
+        return updated_item
+
+    async def delete_item(self, item_id: int) -> bool:
+        with self._lock:
+            if self._items.pop(item_id, None) is None:
+                return False
+            self._ids.discard(item_id)
+            self._names.remove(item_id)
+        return True
+
+
+# Statements are kept constant so asyncpg prepares each once per pooled connection
+# and reuses it from its statement cache afterwards.
+INSERT_ITEM = """
+    INSERT INTO items (name, created_at, updated_at)
+    VALUES ($1, $2, $3)
+    RETURNING id, name, created_at, updated_at
+"""
+# Rows are numbered so that ids, drawn from the sequence in row order, follow input order
+INSERT_ITEMS = """
+    INSERT INTO items (name, created_at, updated_at)
+    SELECT name, created_at, updated_at
+    FROM unnest($1::varchar[], $2::timestamptz[], $3::timestamptz[])
+        WITH ORDINALITY AS batch (name, created_at, updated_at, position)
+    ORDER BY position
+    RETURNING id, name, created_at, updated_at
+"""
+SELECT_ITEM = "SELECT id, name, created_at, updated_at FROM items WHERE id = $1"
+SELECT_ITEMS = "SELECT id, name, created_at, updated_at FROM items ORDER BY id OFFSET $1 LIMIT $2"
+# Names are ordered byte-wise (COLLATE "C"), as the in-memory index orders them. That
+# order lets prefix LIKE patterns range-scan idx_items_name_c; exact matches use
+# idx_items_name and substring patterns the idx_items_name_trgm trigram index.
+SEARCH_ITEMS = {
+    "exact": """
+        SELECT id, name, created_at, updated_at FROM items
+        WHERE name = $1 ORDER BY id OFFSET $2 LIMIT $3
+    """,
+    "prefix": """
+        SELECT id, name, created_at, updated_at FROM items
+        WHERE name COLLATE "C" LIKE $1 ORDER BY name COLLATE "C", id OFFSET $2 LIMIT $3
+    """,
+    "substring": """
+        SELECT id, name, created_at, updated_at FROM items
+        WHERE name LIKE $1 ORDER BY name COLLATE "C", id OFFSET $2 LIMIT $3
+    """,
+}
+SELECT_ALL_ITEMS = "SELECT id, name, created_at, updated_at FROM items ORDER BY id"
+UPDATE_ITEM = """
+    UPDATE items SET name = $2, updated_at = $3
+    WHERE id = $1
+    RETURNING id, name, created_at, updated_at
+"""
+# Optimistic concurrency: only applies if the row is still at the version the caller saw
+UPDATE_ITEM_IF_UNCHANGED = """
+    UPDATE items SET name = $2, updated_at = $3
+    WHERE id = $1 AND updated_at = $4
+    RETURNING id, name, created_at, updated_at
+"""
+DELETE_ITEM = "DELETE FROM items WHERE id = $1"
+
+
+def like_escape(text: str) -> str:
+    """Escape LIKE's wildcards (and its default escape character) in ``text``."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def as_utc(value: datetime) -> datetime:
+    """Mark a naive datetime as UTC, which asyncpg would otherwise read as local time."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def record_to_item(record: Record) -> Item:
+    return Item.model_validate(dict(record))
+
+
+class PostgresItemsRepository:
+    """Item store on the shared ``items`` table, consistent across workers and replicas."""
+
+    def __init__(self, pool: DatabasePool = db_pool) -> None:
+        self._pool = pool
+
+    async def add_item(self, item: Item) -> Item:
+        async with self._pool.connection() as conn:
+            record = await conn.fetchrow(
+                INSERT_ITEM, item.name, as_utc(item.created_at), as_utc(item.updated_at)
+            )
+        return record_to_item(record)
+
+    async def add_items(self, items: list[Item]) -> list[Item]:
+        """Insert ``items`` with one multi-row statement and return them in input order."""
+        async with self._pool.connection() as conn:
+            records = await conn.fetch(
+                INSERT_ITEMS,
+                [item.name for item in items],
+                [as_utc(item.created_at) for item in items],
+                [as_utc(item.updated_at) for item in items],
+            )
+        return sorted((record_to_item(record) for record in records), key=lambda item: item.id or 0)
+
+    async def get_item(self, item_id: int) -> Item | None:
+        async with self._pool.connection() as conn:
+            record = await conn.fetchrow(SELECT_ITEM, item_id)
+        return record_to_item(record) if record else None
+
+    async def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]:
+        async with self._pool.connection() as conn:
+            records = await conn.fetch(SELECT_ITEMS, skip, limit)
+        return [record_to_item(record) for record in records]
+
+    async def search_items(
+        self, query: str, match: SearchMatch, skip: int = 0, limit: int = 10
+    ) -> list[Item]:
+        pattern = query
+        if match != "exact":
+            pattern = like_escape(query) + "%"
+            if match == "substring":
+                pattern = "%" + pattern
+        async with self._pool.connection() as conn:
+            records = await conn.fetch(SEARCH_ITEMS[match], pattern, skip, limit)
+        return [record_to_item(record) for record in records]
+
+    async def iter_items(self, batch_size: int = 500) -> AsyncIterator[Item]:
+        """Stream every item through a server-side cursor fetching ``batch_size`` rows at a time."""
+        async with (
+            self._pool.connection() as conn,
+            conn.transaction(isolation="repeatable_read", readonly=True),
+        ):
+            async for record in conn.cursor(SELECT_ALL_ITEMS, prefetch=batch_size):
+                yield record_to_item(record)
+
+    async def update_item(
+        self, item_id: int, updated_item: Item, expected_updated_at: datetime | None = None
+    ) -> Item | None:
+        """Update the item, only if it is still at ``expected_updated_at`` when that is given."""
+        async with self._pool.connection() as conn:
+            if expected_updated_at is None:
+                record = await conn.fetchrow(
+                    UPDATE_ITEM, item_id, updated_item.name, as_utc(updated_item.updated_at)
+                )
+            else:
+                record = await conn.fetchrow(
+                    UPDATE_ITEM_IF_UNCHANGED,
+                    item_id,
+                    updated_item.name,
+                    as_utc(updated_item.updated_at),
+                    as_utc(expected_updated_at),
+                )
+        return record_to_item(record) if record else None
+
+    async def delete_item(self, item_id: int) -> bool:
+        async with self._pool.connection() as conn:
+            status = await conn.execute(DELETE_ITEM, item_id)
+        return bool(status == "DELETE 1")
+
+
+class CachedItemsRepository:
+    """Read-through cache in front of another backend; every write invalidates it."""
+
+    def __init__(self, backend: ItemsBackend, cache: VersionedCache) -> None:
+        self._backend = backend
+        self._cache = cache
+
+    async def add_item(self, item: Item) -> Item:
+        created = await self._backend.add_item(item)
+        await self._cache.invalidate()
+        return created
+
+    async def add_items(self, items: list[Item]) -> list[Item]:
+        created = await self._backend.add_items(items)
+        await self._cache.invalidate()
+        return created
+
+    async def get_item(self, item_id: int) -> Item | None:
+        async def load() -> bytes:
+            return item_or_none_adapter.dump_json(await self._backend.get_item(item_id))
+
+        data = await self._cache.get_or_load("item", f"item:{item_id}", load)
+        return item_or_none_adapter.validate_json(data)
+
+    async def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]:
+        async def load() -> bytes:
+            return item_list_adapter.dump_json(await self._backend.get_items(skip, limit))
+
+        data = await self._cache.get_or_load("list", f"list:{skip}:{limit}", load)
+        return item_list_adapter.validate_json(data)
+
+    async def search_items(
+        self, query: str, match: SearchMatch, skip: int = 0, limit: int = 10
+    ) -> list[Item]:
+        async def load() -> bytes:
+            return item_list_adapter.dump_json(
+                await self._backend.search_items(query, match, skip, limit)
+            )
+
+        # Hashed: the query is client input of any length
+        query_key = hashlib.sha256(query.encode()).hexdigest()[:32]
+        data = await self._cache.get_or_load(
+            "search", f"search:{match}:{skip}:{limit}:{query_key}", load
+        )
+        return item_list_adapter.validate_json(data)
+
+    def iter_items(self, batch_size: int = 500) -> AsyncIterator[Item]:
+        return self._backend.iter_items(batch_size)
+
+    async def update_item(
+        self, item_id: int, updated_item: Item, expected_updated_at: datetime | None = None
+    ) -> Item | None:
+        updated = await self._backend.update_item(item_id, updated_item, expected_updated_at)
+        if updated is not None:
+            await self._cache.invalidate()
+        return updated
+
+    async def delete_item(self, item_id: int) -> bool:
+        deleted = await self._backend.delete_item(item_id)
+        if deleted:
+            await self._cache.invalidate()
+        return deleted
+
+
+class CoalescingItemsRepository:
+    """Another backend whose single-item creates are batched into ``add_items`` calls."""
+
+    def __init__(self, backend: ItemsBackend, config: Settings = settings) -> None:
+        self._backend = backend
+        self._coalescer = WriteCoalescer(backend.add_items, config)
+
+    async def add_item(self, item: Item) -> Item:
+        """
+        Create ``item`` in the next batch.
+
+        Raises:
+            WriteQueueFullError: If the write queue stayed full for ITEMS_WRITE_QUEUE_TIMEOUT
+        """
+        return await self._coalescer.submit(item)
+
+    async def add_items(self, items: list[Item]) -> list[Item]:
+        return await self._backend.add_items(items)
+
+    async def get_item(self, item_id: int) -> Item | None:
+        return await self._backend.get_item(item_id)
+
+    async def get_items(self, skip: int = 0, limit: int = 10) -> list[Item]:
+        return await self._backend.get_items(skip, limit)
+
+    async def search_items(
+        self, query: str, match: SearchMatch, skip: int = 0, limit: int = 10
+    ) -> list[Item]:
+        return await self._backend.search_items(query, match, skip, limit)
+
+    def iter_items(self, batch_size: int = 500) -> AsyncIterator[Item]:
+        return self._backend.iter_items(batch_size)
+
+    async def update_item(
+        self, item_id: int, updated_item: Item, expected_updated_at: datetime | None = None
+    ) -> Item | None:
+        return await self._backend.update_item(item_id, updated_item, expected_updated_at)
+
+    async def delete_item(self, item_id: int) -> bool:
+        return await self._backend.delete_item(item_id)
+
+    async def close(self) -> None:
+        """Write the creates still queued; called on shutdown, before the pool closes."""
+        await self._coalescer.close()
+
+
+def create_items_repository(config: Settings = settings) -> ItemsBackend:
+    """
+    Build the item store selected by ``ITEMS_BACKEND``.
+
+    With FEATURE_CACHE_ENABLED the Postgres store is fronted by the Redis cache,
+    and with ITEMS_WRITE_COALESCING_ENABLED its creates are batched. The
+    in-memory store is never cached: it is faster than Redis and private to
+    each process, so a shared cache would mix data between workers. Nor are its
+    creates batched, as they cost no round trip.
+
+    Raises:
+        ValueError: If ITEMS_BACKEND names an unknown backend
+    """
+    if config.ITEMS_BACKEND == "memory":
+        return ItemsRepository()
+    if config.ITEMS_BACKEND == "postgres":
+        backend: ItemsBackend = PostgresItemsRepository()
+        if config.FEATURE_CACHE_ENABLED:
+            backend = CachedItemsRepository(backend, VersionedCache("items"))
+        if config.ITEMS_WRITE_COALESCING_ENABLED:
+            # Outermost, so that a batch invalidates the cache once
+            backend = CoalescingItemsRepository(backend, config)
+        return backend
+    raise ValueError(f"Unknown ITEMS_BACKEND: {config.ITEMS_BACKEND}")
@@ -0,0 +1,186 @@
+"""
+In-memory name index behind the item store's exact, prefix and substring search.
+
+Results are ordered by name (code point order, which matches Postgres' "C"
+collation), then id. Exact matches are a dict lookup, prefix matches a range of
+a chunked sorted list, and substring matches only recheck the items holding the
+query's rarest trigram, so no query scans every item unless it is shorter than
+a trigram.
+"""
+
+import bisect
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice, takewhile
+from typing import Generic, Literal, TypeVar
+
+T = TypeVar("T", str, int)
+
+SearchMatch = Literal["exact", "prefix", "substring"]
+
+# Shorter substrings hold no trigram, so neither this index nor pg_trgm can narrow them
+MIN_SUBSTRING_LENGTH = 3
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SortedList(Generic[T]):
+    """
+    Sorted set of strings or ints held in chunks of at most ``2 * chunk_size``.
+
+    An insert or removal shifts one chunk rather than the whole list, so it stays
+    cheap at millions of entries, and reaching a position only steps over whole
+    chunks. Chunks are created by splitting full ones, so there are never more
+    than one per ``chunk_size`` values ever added.
+    """
+
+    def __init__(self, chunk_size: int = 1000) -> None:
+        self._chunk_size = chunk_size
+        self._chunks: list[list[T]] = []
+        self._maxes: list[T] = []
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._chunks)
+
+    def at(self, start: int, stop: int) -> list[T]:
+        """Return the values at positions ``start`` to ``stop``, like ``list[start:stop]``."""
+        count = max(stop - start, 0)
+        values: list[T] = []
+        for chunk in self._chunks:
+            if len(values) == count:
+                break
+            if start >= len(chunk):
+                start -= len(chunk)
+                continue
+            values.extend(chunk[start : start + count - len(values)])
+            start = 0
+        return values
+
+    def add(self, value: T) -> None:
+        if not self._chunks:
+            self._chunks.append([value])
+            self._maxes.append(value)
+            return
+        # Past every chunk's maximum, the value extends the last chunk
+        index = min(bisect.bisect_left(self._maxes, value), len(self._maxes) - 1)
+        chunk = self._chunks[index]
+        position = bisect.bisect_left(chunk, value)
+        if position < len(chunk) and chunk[position] == value:
+            return
+        chunk.insert(position, value)
+        self._maxes[index] = chunk[-1]
+        if len(chunk) > 2 * self._chunk_size:
+            half = self._chunk_size
+            self._chunks[index : index + 1] = [chunk[:half], chunk[half:]]
+            self._maxes[index : index + 1] = [chunk[half - 1], chunk[-1]]
+
+    def discard(self, value: T) -> None:
+        index = bisect.bisect_left(self._maxes, value)
+        if index == len(self._maxes):
+            return
+        chunk = self._chunks[index]
+        position = bisect.bisect_left(chunk, value)
+        if position == len(chunk) or chunk[position] != value:
+            return
+        del chunk[position]
+        if chunk:
+            self._maxes[index] = chunk[-1]
+        else:
+            del self._chunks[index]
+            del self._maxes[index]
+
+    def iter_from(self, start: T) -> Iterator[T]:
+        """Yield the strings not less than ``start``, in order."""
+        index = bisect.bisect_left(self._maxes, start)
+        if index == len(self._chunks):
+            return
+        first = self._chunks[index]
+        yield from islice(first, bisect.bisect_left(first, start), None)
+        for chunk in self._chunks[index + 1 :]:
+            yield from chunk
+
+
+class NameIndex:
+    """
+    Ids by name, plus the sorted names and trigram postings that search needs.
+
+    Postings are append-only arrays of item ids: entries left behind by renames
+    and removals are skipped when candidates are rechecked, and the postings are
+    rebuilt once such stale entries outnumber the live ones.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, list[int]] = {}
+        self._names: SortedList[str] = SortedList()
+        self._name_of: dict[int, str] = {}
+        self._postings: dict[str, array[int]] = {}
+        self._live_postings = 0
+        self._stale_postings = 0
+
+    def add(self, name: str, item_id: int) -> None:
+        self._name_of[item_id] = name
+        self._index_trigrams(name, item_id)
+        ids = self._ids.get(name)
+        if ids is not None:
+            bisect.insort(ids, item_id)
+            return
+        self._ids[name] = [item_id]
+        self._names.add(name)
+
+    def remove(self, item_id: int) -> None:
+        name = self._name_of.pop(item_id, None)
+        if name is None:
+            return
+        grams = len(trigrams(name))
+        self._live_postings -= grams
+        self._stale_postings += grams
+        if self._stale_postings > self._live_postings:
+            self._rebuild_postings()
+        ids = self._ids[name]
+        ids.remove(item_id)
+        if not ids:
+            del self._ids[name]
+            self._names.discard(name)
+
+    def search(self, query: str, match: SearchMatch, limit: int) -> list[int]:
+        """Return the ids of the first ``limit`` matching items by name, then id."""
+        if match == "exact":
+            return self._ids.get(query, [])[:limit]
+        if match == "prefix":
+            names = takewhile(lambda name: name.startswith(query), self._names.iter_from(query))
+            return list(islice(chain.from_iterable(self._ids[name] for name in names), limit))
+        return [item_id for _, item_id in heapq.nsmallest(limit, self._containing(query))]
+
+    def _containing(self, query: str) -> Iterator[tuple[str, int]]:
+        grams = trigrams(query)
+        if not grams:
+            # Shorter than a trigram, nothing to look up (pg_trgm scans here too)
+            candidates: Iterable[int] = self._name_of
+        else:
+            # The rarest trigram's postings are the smallest superset of the matches
+            rarest = min((self._postings.get(gram, array("q")) for gram in grams), key=len)
+            # A renamed item can be listed twice under a trigram both names share
+            candidates = dict.fromkeys(rarest) if self._stale_postings else rarest
+        for item_id in candidates:
+            name = self._name_of.get(item_id)
+            # Rechecked: postings may be stale, and trigrams may occur apart
+            if name is not None and query in name:
+                yield name, item_id
+
+    def _index_trigrams(self, name: str, item_id: int) -> None:
+        grams = trigrams(name)
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("q")
+            postings.append(item_id)
+        self._live_postings += len(grams)
+
+    def _rebuild_postings(self) -> None:
+        self._postings = {}
+        self._live_postings = self._stale_postings = 0
+        for item_id, name in self._name_of.items():
+            self._index_trigrams(name, item_id)
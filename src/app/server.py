@@ -0,0 +1,196 @@
+"""
+Production launcher: ``python -m src.app.server``.
+
+Runs one uvicorn worker (uvloop + httptools) per CPU the container may use, all
+accepting on a socket bound once by this supervisor. Workers that reach their
+request budget drain and exit, and are replaced; SIGTERM or SIGINT drains every
+worker before the supervisor exits.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from socket import socket
+from types import FrameType
+
+import structlog
+import uvicorn
+
+from .config import Settings, settings
+
+logger = structlog.get_logger(__name__)
+
+APP = "src.app.main:app"
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# A worker failing this soon after it was started is treated as a crash loop
+# (e.g. an import error) rather than recycled, so the supervisor gives up.
+MIN_WORKER_LIFETIME = 5.0
+
+spawn = multiprocessing.get_context("spawn")
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> float | None:
+    """
+    Read the CPU quota of the current cgroup, in CPUs.
+
+    Returns:
+        float | None: e.g. 1.5 for a 150ms/100ms quota, or None when unlimited
+    """
+    try:  # cgroup v2: "<quota|max> <period>"
+        quota, period = (root / "cpu.max").read_text().split()
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:  # cgroup v1: quota is -1 when unlimited
+        quota_us = int((root / "cpu" / "cpu.cfs_quota_us").read_text())
+        period_us = int((root / "cpu" / "cpu.cfs_period_us").read_text())
+        return quota_us / period_us if quota_us > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def worker_count(config: Settings = settings, root: Path = CGROUP_ROOT) -> int:
+    """
+    Size the worker pool: SERVER_WORKERS if set, else the cgroup CPU quota, else
+    CONTAINER_CPU_LIMIT, never more than the CPUs this process may run on.
+    """
+    if config.SERVER_WORKERS > 0:
+        return config.SERVER_WORKERS
+
+    available = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    available = available or os.cpu_count() or 1
+    limit = cgroup_cpu_limit(root)
+    if limit is None:
+        try:
+            limit = float(config.CONTAINER_CPU_LIMIT)
+        except ValueError:
+            logger.warning("invalid_cpu_limit", value=config.CONTAINER_CPU_LIMIT)
+            return available
+    return max(1, min(available, math.ceil(limit)))
+
+
+def worker_config(config: Settings = settings) -> uvicorn.Config:
+    """Build one worker's uvicorn config, with its own jittered request budget."""
+    max_requests = None
+    if config.SERVER_MAX_REQUESTS > 0:
+        # Staggered so that workers started together are not recycled together
+        jitter = random.randint(0, config.SERVER_MAX_REQUESTS_JITTER)  # noqa: S311  # nosec B311
+        max_requests = config.SERVER_MAX_REQUESTS + jitter
+    return uvicorn.Config(
+        APP,
+        host=config.APP_HOST,
+        port=config.APP_PORT,
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+        log_level=config.APP_LOG_LEVEL.lower(),
+        access_log=False,  # LoggingMiddleware logs each request once
+        timeout_keep_alive=config.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=max_requests,
+    )
+
+
+def _serve(config: uvicorn.Config, sockets: list[socket]) -> None:
+    config.configure_logging()
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+class Supervisor:
+    def __init__(self, workers: int, config: Settings = settings) -> None:
+        self.workers = workers
+        self._config = config
+        self._processes: list[SpawnProcess] = []
+        self._started_at: dict[int, float] = {}
+        self._should_exit = threading.Event()
+
+    def run(self) -> int:
+        """
+        Serve until signalled, then drain every worker.
+
+        Returns:
+            int: Process exit code
+        """
+        clear_multiprocess_dir()
+        sock = worker_config(self._config).bind_socket()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._handle_exit)
+
+        logger.info("server_starting", workers=self.workers, pid=os.getpid())
+        exit_code = 0
+        try:
+            self._processes = [self._spawn(sock) for _ in range(self.workers)]
+            while not self._should_exit.wait(0.5):
+                if not self._replace_exited(sock):
+                    exit_code = 1
+                    break
+        finally:
+            self._drain()
+            sock.close()
+        logger.info("server_stopped", exit_code=exit_code)
+        return exit_code
+
+    def _spawn(self, sock: socket) -> SpawnProcess:
+        process = spawn.Process(target=_serve, args=(worker_config(self._config), [sock]))
+        process.start()
+        assert process.pid is not None  # noqa: S101 - set by start()
+        self._started_at[process.pid] = time.monotonic()
+        return process
+
+    def _replace_exited(self, sock: socket) -> bool:
+        for index, process in enumerate(self._processes):
+            if process.is_alive() or self._should_exit.is_set():
+                continue
+            assert process.pid is not None  # noqa: S101 - process was started
+            lifetime = time.monotonic() - self._started_at.pop(process.pid)
+            if process.exitcode != 0 and lifetime < MIN_WORKER_LIFETIME:
+                logger.error("worker_crash_loop", pid=process.pid, exitcode=process.exitcode)
+                return False
+            logger.info("worker_recycled", pid=process.pid, exitcode=process.exitcode)
+            self._processes[index] = self._spawn(sock)
+        return True
+
+    def _drain(self) -> None:
+        # SIGTERM makes uvicorn stop accepting, finish in-flight requests (up to
+        # timeout_graceful_shutdown) and run the lifespan shutdown
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + self._config.SERVER_GRACEFUL_TIMEOUT + 5
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("worker_killed", pid=process.pid)
+                process.kill()
+                process.join()
+
+    def _handle_exit(self, _signum: int, _frame: FrameType | None) -> None:
+        self._should_exit.set()
+
+
+def clear_multiprocess_dir() -> None:
+    """Remove metric files left by workers of a previous run."""
+    if directory := os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("*.db"):
+            stale.unlink()
+
+
+def run(config: Settings = settings) -> int:
+    workers = worker_count(config)
+    if workers > 1 and not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        logger.warning("metrics_per_worker", hint="set PROMETHEUS_MULTIPROC_DIR")
+    return Supervisor(workers, config).run()
+
+
+if __name__ == "__main__":
+    sys.exit(run())
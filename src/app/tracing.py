@@ -0,0 +1,84 @@
+"""
+OpenTelemetry setup for the FastAPI instrumentation.
+
+Imported only when OTEL_ENABLED. With OTEL_EXPORTER=none the instrumentation
+uses the global no-op provider; otherwise spans are sampled parent-based at
+OTEL_SAMPLE_RATIO and exported in batches.
+"""
+
+from typing import TYPE_CHECKING
+
+import structlog
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from .config import Settings, settings
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+logger = structlog.get_logger(__name__)
+
+
+def create_exporter(name: str) -> SpanExporter | None:
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.error("otlp_exporter_unavailable", package="opentelemetry-exporter-otlp")
+            return None
+        otlp_exporter: SpanExporter = OTLPSpanExporter()  # endpoint from OTEL_EXPORTER_OTLP_*
+        return otlp_exporter
+    if name != "none":
+        logger.error("unknown_span_exporter", exporter=name)
+    return None
+
+
+def create_tracer_provider(
+    config: Settings = settings, exporter: SpanExporter | None = None
+) -> TracerProvider | None:
+    """
+    Build a sampling, batching tracer provider, or None when nothing is exported.
+
+    Returns:
+        TracerProvider | None: The provider; callers shut it down to flush spans
+    """
+    exporter = exporter or create_exporter(config.OTEL_EXPORTER)
+    if exporter is None:
+        return None
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": config.APP_NAME, "service.version": config.APP_VERSION}
+        ),
+        # Keeps whole traces: a sampled upstream caller is always followed
+        sampler=ParentBased(TraceIdRatioBased(config.OTEL_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=config.OTEL_BSP_MAX_QUEUE_SIZE,
+            schedule_delay_millis=config.OTEL_BSP_SCHEDULE_DELAY,
+            max_export_batch_size=config.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+        )
+    )
+    return provider
+
+
+def instrument_app(
+    app: "FastAPI", config: Settings = settings, exporter: SpanExporter | None = None
+) -> TracerProvider | None:
+    """Instrument ``app``, skipping OTEL_EXCLUDED_URLS, and return its tracer provider."""
+    provider = create_tracer_provider(config, exporter)
+    FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=provider, excluded_urls=config.OTEL_EXCLUDED_URLS
+    )
+    return provider
@@ -0,0 +1,25 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from src.app.assets import Manifest, build_assets
+
+
+@pytest.mark.unit
+def test_build_assets_fingerprints_and_precompresses(tmp_path: Path) -> None:
+    source = tmp_path / "static"
+    (source / "js").mkdir(parents=True)
+    script = b"console.log('hello');\n" * 50
+    (source / "js" / "app.js").write_bytes(script)
+    (source / "logo.png").write_bytes(b"\x89PNG")
+
+    manifest = build_assets(source, tmp_path / "dist")
+
+    hashed = manifest.assets["js/app.js"]
+    assert hashed.startswith("js/app.") and hashed.endswith(".js")  # nosec
+    assert (tmp_path / "dist" / hashed).read_bytes() == script  # nosec
+    assert gzip.decompress((tmp_path / "dist" / f"{hashed}.gz").read_bytes()) == script  # nosec
+    assert "gzip" in manifest.encodings[hashed]  # nosec
+    assert "logo.png" not in manifest.encodings  # nosec
+    assert Manifest.load(tmp_path / "dist") == manifest  # nosec
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jwt.algorithms import ECAlgorithm, RSAAlgorithm
+from passlib.hash import bcrypt
+
+from src.app.auth import ApiKeyRegistry, JwtVerifier
+from src.app.config import Settings
+
+
+def write_registry(path: Path, keys: dict[str, str]) -> None:
+    path.write_text(
+        json.dumps({key_id: bcrypt.using(rounds=4).hash(s) for key_id, s in keys.items()})
+    )
+
+
+@pytest.mark.unit
+def test_hashed_keys_are_verified_and_cached(tmp_path: Path) -> None:
+    path = tmp_path / "keys.json"
+    write_registry(path, {"alpha": "s3cret"})
+    registry = ApiKeyRegistry(Settings(API_KEY="", API_KEYS_FILE=str(path)))
+
+    async def check() -> list[str | None]:
+        first = await asyncio.gather(*(registry.verify("alpha.s3cret") for _ in range(5)))
+        return [*first, await registry.verify("alpha.wrong"), await registry.verify("beta.s3cret")]
+
+    assert asyncio.run(check()) == ["alpha"] * 5 + [None, None]  # nosec
+    assert len(registry._cache) == 3  # nosec
+    # Only ids of registered keys are safe to log; anything else may be a secret
+    assert registry.registered_id("alpha.wrong") == "alpha"  # nosec
+    assert registry.registered_id("beta.s3cret") is None  # nosec
+    assert registry.registered_id("alpha") is None  # nosec
+
+
+@pytest.mark.unit
+def test_revoked_key_stops_working_after_reload(tmp_path: Path) -> None:
+    path = tmp_path / "keys.json"
+    write_registry(path, {"alpha": "s3cret"})
+    registry = ApiKeyRegistry(
+        Settings(API_KEY="legacy", API_KEYS_FILE=str(path), API_KEY_RELOAD_INTERVAL=0)
+    )
+    assert asyncio.run(registry.verify("alpha.s3cret")) == "alpha"  # nosec
+    assert asyncio.run(registry.verify("legacy")) == "default"  # nosec
+
+    write_registry(path, {})
+    assert asyncio.run(registry.verify("alpha.s3cret")) is None  # nosec
+
+
+def make_jwks() -> tuple[str, dict[str, Any]]:
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    jwks = {
+        "keys": [
+            {
+                **RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True),
+                "kid": "rsa",
+                "alg": "RS256",
+            },
+            {**ECAlgorithm.to_jwk(ec_key.public_key(), as_dict=True), "kid": "ec", "alg": "ES256"},
+        ]
+    }
+    return json.dumps(jwks), {"rsa": rsa_key, "ec": ec_key}
+
+
+@pytest.mark.unit
+def test_bearer_tokens_are_verified_and_cached() -> None:
+    jwks, private_keys = make_jwks()
+    verifier = JwtVerifier(Settings(JWT_JWKS=jwks, JWT_AUDIENCE="items", JWT_LEEWAY=0))
+    claims = {"sub": "client-1", "aud": "items", "exp": int(time.time()) + 60}
+    rs256 = jwt.encode(claims, private_keys["rsa"], algorithm="RS256", headers={"kid": "rsa"})
+    es256 = jwt.encode(claims, private_keys["ec"], algorithm="ES256", headers={"kid": "ec"})
+
+    assert verifier.verify(rs256)["sub"] == "client-1"  # type: ignore[index]  # nosec
+    assert verifier.verify(es256)["sub"] == "client-1"  # type: ignore[index]  # nosec
+    assert verifier.verify(rs256) is not None and len(verifier._cache) == 2  # nosec
+
+    forged = jwt.encode(claims, private_keys["ec"], algorithm="ES256", headers={"kid": "rsa"})
+    expired = jwt.encode(
+        {**claims, "exp": int(time.time()) - 1}, private_keys["rsa"], "RS256", {"kid": "rsa"}
+    )
+    other_audience = jwt.encode(
+        {**claims, "aud": "other"}, private_keys["rsa"], "RS256", {"kid": "rsa"}
+    )
+    for token in (forged, expired, other_audience, "not-a-token"):
+        assert verifier.verify(token) is None  # nosec
+
+
+@pytest.mark.unit
+def test_empty_audience_and_issuer_are_not_required() -> None:
+    jwks, private_keys = make_jwks()
+    verifier = JwtVerifier(Settings(JWT_JWKS=jwks, JWT_AUDIENCE="", JWT_ISSUER=""))
+    claims = {"sub": "client-1", "exp": int(time.time()) + 60}
+    token = jwt.encode(claims, private_keys["rsa"], algorithm="RS256", headers={"kid": "rsa"})
+    with_audience = jwt.encode(
+        {**claims, "aud": "items"}, private_keys["rsa"], "RS256", {"kid": "rsa"}
+    )
+
+    assert verifier.verify(token)["sub"] == "client-1"  # type: ignore[index]  # nosec
+    assert verifier.verify(with_audience) is None  # nosec
@@ -0,0 +1,35 @@
+import pytest
+
+from src.app.api.bulk import JSONArrayParser, NDJSONParser
+
+
+@pytest.mark.unit
+def test_json_array_parser_handles_elements_split_across_chunks() -> None:
+    body = '[{"name": "a"}, {"name": "b\\u00e9"} ,{"name": "c"}]'.encode()
+    parser = JSONArrayParser()
+
+    values = []
+    for i in range(0, len(body), 3):
+        values.extend(parser.feed(body[i : i + 3]))
+    values.extend(parser.close())
+
+    assert values == [{"name": "a"}, {"name": "bé"}, {"name": "c"}]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("body", [b'{"name": "a"}', b'[{"name": "a"} {"name": "b"}]', b"[{"])
+def test_json_array_parser_rejects_malformed_bodies(body: bytes) -> None:
+    parser = JSONArrayParser()
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        parser.feed(body)
+        parser.close()
+
+
+@pytest.mark.unit
+def test_ndjson_parser_keeps_partial_lines_until_complete() -> None:
+    parser = NDJSONParser()
+
+    assert parser.feed(b'{"name": "a"}\n{"na') == [{"name": "a"}]  # nosec
+    assert parser.feed(b'me": "b"}\n\n') == [{"name": "b"}]  # nosec
+    assert parser.close() == []  # nosec
@@ -0,0 +1,168 @@
+import asyncio
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.app.cache import VersionedCache, cache_errors
+from src.app.models import Item
+from src.app.repositories import CachedItemsRepository, ItemsRepository
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        self._commands.append(("set", args, kwargs))
+
+    def delete(self, *args: Any, **kwargs: Any) -> None:
+        self._commands.append(("delete", args, kwargs))
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeRedis:
+    """The commands VersionedCache uses, on a dict; LOOKUP_SCRIPT is emulated."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.locks_taken = 0
+
+    def register_script(self, script: str) -> Any:
+        async def lookup(keys: list[str], args: list[str], client: Any) -> list[bytes]:
+            version = self.data.get(keys[0], b"0")
+            entry = self.data.get(f"{args[0]}{version.decode()}:{args[1]}")
+            return [version] if entry is None else [version, entry]
+
+        return lookup
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, nx: bool = False, **expiry: int) -> bool | None:
+        if nx and key in self.data:
+            return None
+        if key.endswith(":lock"):
+            self.locks_taken += 1
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class DownRedis(FakeRedis):
+    def register_script(self, script: str) -> Any:
+        async def lookup(*args: Any, **kwargs: Any) -> list[bytes]:
+            raise RedisConnectionError("Connection refused")
+
+        return lookup
+
+    async def incr(self, key: str) -> int:
+        raise RedisConnectionError("Connection refused")
+
+
+class FakePool:
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+
+
+class CountingLoader:
+    def __init__(self, value: bytes, delay: float = 0.0) -> None:
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def make_cache(redis: FakeRedis) -> VersionedCache:
+    return VersionedCache("test", pool=FakePool(redis))  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalidate_bumps_the_version() -> None:
+    redis = FakeRedis()
+    cache = make_cache(redis)
+    loader = CountingLoader(b"value")
+
+    assert await cache.get_or_load("item", "item:1", loader) == b"value"  # nosec
+    assert await cache.get_or_load("item", "item:1", loader) == b"value"  # nosec
+    assert loader.calls == 1  # nosec
+
+    await cache.invalidate()
+    assert redis.data["cache:test:version"] == b"1"  # nosec
+    await cache.get_or_load("item", "item:1", loader)
+    assert loader.calls == 2  # nosec
+    assert "cache:test:v1:item:1" in redis.data  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_writes_invalidate_reads() -> None:
+    repo = CachedItemsRepository(ItemsRepository(), make_cache(FakeRedis()))
+    await repo.add_item(Item(name="first"))
+    assert [item.name for item in await repo.get_items()] == ["first"]  # nosec
+
+    await repo.add_item(Item(name="second"))
+    await repo.update_item(1, Item(name="renamed"))
+
+    assert [item.name for item in await repo.get_items()] == ["renamed", "second"]  # nosec
+    assert (await repo.get_item(1)) == (await repo.get_items())[0]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_the_backend_when_redis_is_down() -> None:
+    errors = cache_errors.labels(namespace="test")
+    before = errors._value.get()
+    cache = make_cache(DownRedis())
+    loader = CountingLoader(b"value")
+
+    assert await cache.get_or_load("item", "item:1", loader) == b"value"  # nosec
+    await cache.invalidate()
+    assert await cache.get_or_load("item", "item:1", loader) == b"value"  # nosec
+
+    assert loader.calls == 2  # nosec
+    assert errors._value.get() - before == 3  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_misses_take_the_lock_once() -> None:
+    redis = FakeRedis()
+    # Two caches on one Redis stand in for two worker processes
+    caches = [make_cache(redis), make_cache(redis)]
+    loader = CountingLoader(b"value", delay=0.05)
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("list", "list:0:10", loader) for cache in caches for _ in range(5))
+    )
+
+    assert results == [b"value"] * 10  # nosec
+    assert loader.calls == 1  # nosec
+    assert redis.locks_taken == 1  # nosec
@@ -0,0 +1,179 @@
+import asyncio
+
+import asyncpg
+import pytest
+
+from src.app.coalescing import WriteCoalescer, WriteQueueFullError
+from src.app.config import Settings
+from src.app.models import Item
+from src.app.repositories import ItemsRepository
+
+
+class RecordingWriter:
+    """Writes to an in-memory store, recording batch sizes; ``gate`` holds every write."""
+
+    def __init__(self) -> None:
+        self.repo = ItemsRepository()
+        self.batches: list[int] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, items: list[Item]) -> list[Item]:
+        await self.gate.wait()
+        self.batches.append(len(items))
+        return await self.repo.add_items(items)
+
+
+def coalescer_settings(**overrides: float) -> Settings:
+    config = {
+        "ITEMS_WRITE_BATCH_SIZE": 10,
+        "ITEMS_WRITE_MAX_DELAY_MS": 50,
+        "ITEMS_WRITE_QUEUE_SIZE": 100,
+        "ITEMS_WRITE_QUEUE_TIMEOUT": 1.0,
+    }
+    return Settings(**{**config, **overrides})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_creates_share_batches() -> None:
+    writer = RecordingWriter()
+    coalescer = WriteCoalescer(writer, coalescer_settings())
+
+    created = await asyncio.gather(*(coalescer.submit(Item(name=f"item-{i}")) for i in range(25)))
+    await coalescer.close()
+
+    assert [item.id for item in created] == list(range(1, 26))  # nosec
+    assert [item.name for item in created] == [f"item-{i}" for i in range(25)]  # nosec
+    assert writer.batches == [10, 10, 5]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_full_queue_rejects_after_timeout() -> None:
+    writer = RecordingWriter()
+    writer.gate.clear()
+    coalescer = WriteCoalescer(
+        writer,
+        coalescer_settings(
+            ITEMS_WRITE_BATCH_SIZE=1, ITEMS_WRITE_QUEUE_SIZE=2, ITEMS_WRITE_QUEUE_TIMEOUT=0.01
+        ),
+    )
+
+    # One create is held by the stalled writer and two fill the queue
+    pending = [asyncio.create_task(coalescer.submit(Item(name=f"item-{i}"))) for i in range(3)]
+    await asyncio.sleep(0)
+    with pytest.raises(WriteQueueFullError):
+        await coalescer.submit(Item(name="rejected"))
+
+    writer.gate.set()
+    await coalescer.close()
+    assert [task.result().id for task in pending] == [1, 2, 3]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_batch_fails_every_caller() -> None:
+    async def failing_writer(items: list[Item]) -> list[Item]:
+        raise ConnectionError("database unavailable")
+
+    coalescer = WriteCoalescer(failing_writer, coalescer_settings())
+
+    results = await asyncio.gather(
+        *(coalescer.submit(Item(name=f"item-{i}")) for i in range(3)), return_exceptions=True
+    )
+    await coalescer.close()
+
+    assert all(isinstance(result, ConnectionError) for result in results)  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_a_rejected_row_fails_only_its_own_create() -> None:
+    writer = RecordingWriter()
+
+    async def strict_writer(items: list[Item]) -> list[Item]:
+        if any(item.name == "bad" for item in items):
+            raise asyncpg.CharacterNotInRepertoireError("invalid byte sequence")
+        return await writer(items)
+
+    coalescer = WriteCoalescer(strict_writer, coalescer_settings())
+
+    results = await asyncio.gather(
+        *(coalescer.submit(Item(name=name)) for name in ["a", "bad", "c"]),
+        return_exceptions=True,
+    )
+    await coalescer.close()
+
+    assert isinstance(results[1], asyncpg.DataError)  # nosec
+    assert [result.name for result in results if isinstance(result, Item)] == ["a", "c"]  # nosec
+    assert writer.batches == [1, 1]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        OSError("connection refused"),
+        TimeoutError(),
+        asyncpg.ConnectionDoesNotExistError("connection was closed"),
+    ],
+)
+async def test_an_outage_fails_the_batch_without_retrying_rows(error: Exception) -> None:
+    calls = 0
+
+    async def failing_writer(items: list[Item]) -> list[Item]:
+        nonlocal calls
+        calls += 1
+        raise error
+
+    coalescer = WriteCoalescer(failing_writer, coalescer_settings(ITEMS_WRITE_BATCH_SIZE=20))
+
+    results = await asyncio.gather(
+        *(coalescer.submit(Item(name=f"item-{i}")) for i in range(20)), return_exceptions=True
+    )
+    await coalescer.close()
+
+    assert all(result is error for result in results)  # nosec
+    assert calls == 1  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_a_short_write_fails_the_batch_and_keeps_the_writer() -> None:
+    writer = RecordingWriter()
+    short = True
+
+    async def lossy_writer(items: list[Item]) -> list[Item]:
+        created = await writer(items)
+        return created[:-1] if short else created
+
+    coalescer = WriteCoalescer(lossy_writer, coalescer_settings())
+
+    results = await asyncio.gather(
+        *(coalescer.submit(Item(name=f"item-{i}")) for i in range(3)), return_exceptions=True
+    )
+    short = False
+    created = await asyncio.wait_for(coalescer.submit(Item(name="next")), 1)
+    await coalescer.close()
+
+    assert all(isinstance(result, RuntimeError) for result in results)  # nosec
+    assert writer.batches == [3, 1]  # nosec
+    assert created.name == "next"  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stopped_writer_fails_queued_creates() -> None:
+    writer = RecordingWriter()
+    writer.gate.clear()
+    coalescer = WriteCoalescer(writer, coalescer_settings(ITEMS_WRITE_BATCH_SIZE=1))
+
+    pending = [asyncio.create_task(coalescer.submit(Item(name=f"item-{i}"))) for i in range(3)]
+    await asyncio.sleep(0)
+    assert coalescer._task is not None  # nosec
+    coalescer._task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+    assert all(isinstance(result, RuntimeError) for result in results)  # nosec
@@ -0,0 +1,104 @@
+import zlib
+
+import pytest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.middleware import CompressionMiddleware
+
+SCOPE: Scope = {
+    "type": "http",
+    "method": "GET",
+    "path": "/",
+    "headers": [(b"accept-encoding", b"gzip")],
+}
+
+
+async def call(app: CompressionMiddleware) -> list[Message]:
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(SCOPE, receive, send)
+    return sent
+
+
+def streaming_app(chunks: list[bytes], content_type: bytes = b"application/x-ndjson") -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    return app
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_streaming_chunks_are_flushed_individually() -> None:
+    chunks = [b'{"id": %d}\n' % i * 20 for i in range(3)]
+
+    sent = await call(CompressionMiddleware(streaming_app(chunks), levels={"gzip": 6}))
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"  # nosec
+    assert b"content-length" not in headers  # nosec
+    decompressor = zlib.decompressobj(31)
+    # Each input chunk is fully decodable as soon as its message arrives
+    for chunk, message in zip(chunks, sent[1:], strict=False):
+        assert decompressor.decompress(message["body"]) == chunk  # nosec
+    assert decompressor.decompress(sent[-1]["body"]) == b""  # nosec
+    assert decompressor.eof  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_small_and_incompressible_bodies_pass_through() -> None:
+    async def small_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"tiny"})
+
+    sent = await call(CompressionMiddleware(small_app, levels={"gzip": 6}, minimum_size=100))
+    assert sent[1]["body"] == b"tiny"  # nosec
+
+    sent = await call(
+        CompressionMiddleware(streaming_app([b"\x89PNG" * 500], b"image/png"), levels={"gzip": 6})
+    )
+    assert b"content-encoding" not in dict(sent[0]["headers"])  # nosec
+    assert sent[1]["body"] == b"\x89PNG" * 500  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_partial_content_passes_through() -> None:
+    body = b"a" * 3000
+
+    async def range_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 206,
+                "headers": [
+                    (b"content-type", b"text/plain"),
+                    (b"content-range", b"bytes 0-2999/11680"),
+                    (b"content-length", b"3000"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    sent = await call(CompressionMiddleware(range_app, levels={"gzip": 6}))
+
+    headers = dict(sent[0]["headers"])
+    assert b"content-encoding" not in headers  # nosec
+    assert headers[b"content-range"] == b"bytes 0-2999/11680"  # nosec
+    assert sent[1]["body"] == body  # nosec
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.datastructures import Headers
+
+from src.app.api.conditional import (
+    item_validators,
+    not_modified,
+    page_validators,
+    precondition_failed,
+)
+from src.app.httputil import http_date
+from src.app.models import Item
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 30, 15, 250_000)
+
+
+@pytest.mark.unit
+def test_validators_follow_item_versions() -> None:
+    item = Item(id=1, name="a", updated_at=UPDATED_AT)
+    edited = Item(id=1, name="b", updated_at=UPDATED_AT + timedelta(microseconds=1))
+    other = Item(id=2, name="a", updated_at=UPDATED_AT)
+
+    assert item_validators(item).etag != item_validators(edited).etag  # nosec
+    assert (
+        item_validators(item).headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+    )  # nosec
+    assert page_validators([item, other]) != page_validators([item])  # nosec
+    assert page_validators([]).last_modified is None  # nosec
+
+
+@pytest.mark.unit
+def test_not_modified_prefers_etags_over_dates() -> None:
+    validators = item_validators(Item(id=1, name="a", updated_at=UPDATED_AT))
+    same_second = http_date(UPDATED_AT.replace(microsecond=0))
+    earlier = http_date(UPDATED_AT - timedelta(seconds=1))
+
+    assert not_modified(Headers({"if-none-match": validators.etag}), validators)  # nosec
+    assert not_modified(Headers({"if-modified-since": same_second}), validators)  # nosec
+    assert not not_modified(Headers({"if-modified-since": earlier}), validators)  # nosec
+    assert not not_modified(  # nosec
+        Headers({"if-none-match": '"stale"', "if-modified-since": same_second}), validators
+    )
+    assert not not_modified(  # nosec
+        Headers({"if-modified-since": same_second}), validators, use_dates=False
+    )
+
+
+@pytest.mark.unit
+def test_if_match() -> None:
+    validators = item_validators(Item(id=1, name="a", updated_at=UPDATED_AT))
+
+    assert not precondition_failed(Headers({}), validators)  # nosec
+    assert not precondition_failed(
+        Headers({"if-match": f"W/{validators.etag}"}), validators
+    )  # nosec
+    assert precondition_failed(Headers({"if-match": '"stale"'}), validators)  # nosec
+    assert precondition_failed(Headers({"if-match": "*"}), None)  # nosec
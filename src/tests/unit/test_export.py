@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from src.app.api.export import CSV_COLUMNS, ExportFormat, export_items
+from src.app.models import Item
+from src.app.repositories import ItemsRepository
+
+CREATED_AT = datetime(2024, 5, 1, 12, 30)
+
+
+async def make_repo(names: list[str]) -> ItemsRepository:
+    repository = ItemsRepository()
+    await repository.add_items(
+        [Item(name=name, created_at=CREATED_AT, updated_at=CREATED_AT) for name in names]
+    )
+    return repository
+
+
+async def export(
+    repo: ItemsRepository, export_format: ExportFormat, chunk_size: int
+) -> list[bytes]:
+    return [chunk async for chunk in export_items(repo, export_format, chunk_size)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ndjson_export_is_sent_in_chunks() -> None:
+    repo = await make_repo([f"item-{i}" for i in range(5)])
+
+    chunks = await export(repo, "ndjson", chunk_size=2)
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]  # nosec
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]  # nosec
+    assert rows[0] == {  # nosec
+        "id": 1,
+        "name": "item-0",
+        "created_at": "2024-05-01T12:30:00",
+        "updated_at": "2024-05-01T12:30:00",
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_csv_export_quotes_names() -> None:
+    names = ["plain", "comma, inside", 'say "hi"', "line\nbreak"]
+    repo = await make_repo(names)
+
+    chunks = await export(repo, "csv", chunk_size=3)
+
+    assert chunks[0] == b"id,name,created_at,updated_at\r\n"  # nosec
+    assert len(chunks) == 3  # nosec
+    body = b"".join(chunks).decode()
+    assert '"comma, inside"' in body and '"say ""hi"""' in body  # nosec
+    rows = list(csv.reader(io.StringIO(body)))
+    assert tuple(rows[0]) == CSV_COLUMNS  # nosec
+    assert [row[1] for row in rows[1:]] == names  # nosec
+    assert rows[1] == ["1", "plain", "2024-05-01T12:30:00", "2024-05-01T12:30:00"]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_empty_collection_exports_only_the_header() -> None:
+    repo = ItemsRepository()
+
+    assert await export(repo, "ndjson", chunk_size=10) == []  # nosec
+    assert await export(repo, "csv", chunk_size=10) == [  # nosec
+        b"id,name,created_at,updated_at\r\n"
+    ]
@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.api import health
+from src.app.config import Settings
+from src.app.db.health import HealthProber
+from src.app.main import create_app
+
+
+class FakeConnection:
+    async def execute(self, query: str) -> str:
+        return "SELECT 1"
+
+
+class FakeDatabase:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[FakeConnection]:
+        if self.error is not None:
+            raise self.error
+        yield FakeConnection()
+
+
+class FakeRedisClient:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def ping(self) -> bool:
+        await asyncio.sleep(self.delay)
+        return True
+
+
+class FakeRedis:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.client = FakeRedisClient(delay)
+
+
+def make_prober(database: FakeDatabase, redis: FakeRedis) -> HealthProber:
+    config = Settings(HEALTH_CHECK_TIMEOUT=0.05)
+    return HealthProber(database, redis, config)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_reports_ready_when_every_dependency_is_up() -> None:
+    prober = make_prober(FakeDatabase(), FakeRedis())
+    assert not prober.ready  # nosec
+
+    report = await prober.probe()
+
+    assert prober.ready and report["status"] == "ready"  # nosec
+    assert report["checks"] == {"database": True, "redis": True, "api": True}  # nosec
+    assert b'"ready"' in prober.report_body  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_reports_failures_and_timeouts() -> None:
+    prober = make_prober(FakeDatabase(ConnectionRefusedError("refused")), FakeRedis(delay=1.0))
+
+    report = await prober.probe()
+
+    assert not prober.ready and report["status"] == "not ready"  # nosec
+    assert report["details"]["database"]["error"] == "refused"  # nosec
+    assert report["details"]["redis"]["status"] == "down"  # nosec
+    assert report["details"]["redis"]["error"] == "TimeoutError"  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("database_error", "status_code"), [(None, 200), (OSError("down"), 503)])
+def test_readiness_status_follows_the_report(
+    monkeypatch: pytest.MonkeyPatch, database_error: Exception | None, status_code: int
+) -> None:
+    prober = make_prober(FakeDatabase(database_error), FakeRedis())
+    asyncio.run(prober.probe())
+    monkeypatch.setattr(health, "health_prober", prober)
+
+    response = TestClient(create_app()).get("/health/ready")
+
+    assert response.status_code == status_code  # nosec
+    assert response.json()["checks"]["database"] is (database_error is None)  # nosec
@@ -0,0 +1,31 @@
+import pytest
+
+from src.app.httputil import accepts_encoding, etag_matches, strong_etag
+
+
+@pytest.mark.unit
+def test_etag_matches_uses_weak_comparison() -> None:
+    etag = strong_etag(b"body")
+
+    assert etag_matches(etag, etag)  # nosec
+    assert etag_matches(f'"other", W/{etag}', etag)  # nosec
+    assert etag_matches("*", etag)  # nosec
+    assert not etag_matches('"other"', etag)  # nosec
+    assert not etag_matches(None, etag)  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("*, gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ],
+)
+def test_accepts_encoding(header: str | None, expected: bool) -> None:
+    assert accepts_encoding(header, "gzip") is expected  # nosec
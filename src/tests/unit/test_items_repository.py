@@ -0,0 +1,136 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import pytest
+
+from src.app.db.pool import DatabasePool
+from src.app.models import Item
+from src.app.repositories import ItemsRepository, PostgresItemsRepository
+
+
+async def make_repo(size: int = 5) -> ItemsRepository:
+    """Build a repository holding ``size`` items."""
+    repository = ItemsRepository()
+    for i in range(size):
+        await repository.add_item(Item(name=f"item-{i}"))
+    return repository
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_items_paginates_in_insertion_order() -> None:
+    repo = await make_repo()
+
+    page = await repo.get_items(skip=1, limit=2)
+
+    assert [item.name for item in page] == ["item-1", "item-2"]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_items_skips_deleted_items() -> None:
+    repo = await make_repo(3000)
+    for item_id in range(1, 2001, 2):
+        await repo.delete_item(item_id)
+
+    page = await repo.get_items(skip=1500, limit=3)
+
+    assert [item.id for item in page] == [2501, 2502, 2503]  # nosec
+    assert await repo.get_items(skip=2000, limit=3) == []  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_item_keeps_position() -> None:
+    repo = await make_repo()
+
+    updated = await repo.update_item(2, Item(name="renamed"))
+
+    assert updated is not None and updated.id == 2  # nosec
+    assert [item.name for item in await repo.get_items(0, 3)] == [  # nosec
+        "item-0",
+        "renamed",
+        "item-2",
+    ]
+    assert await repo.update_item(99, Item(name="missing")) is None  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_item_removes_from_index() -> None:
+    repo = await make_repo()
+
+    assert await repo.delete_item(3) is True  # nosec
+    assert await repo.delete_item(3) is False  # nosec
+    assert await repo.get_item(3) is None  # nosec
+    assert [item.id for item in await repo.get_items(0, 10)] == [1, 2, 4, 5]  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_conditional_update_requires_the_expected_version() -> None:
+    repo = await make_repo()
+    current = await repo.get_item(1)
+    assert current is not None  # nosec
+
+    assert await repo.update_item(1, Item(name="a"), datetime(2000, 1, 1)) is None  # nosec
+    assert await repo.update_item(1, Item(name="b"), current.updated_at) is not None  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_items_tracks_updates_and_deletes() -> None:
+    repo = await make_repo()
+    await repo.update_item(1, Item(name="other"))
+    await repo.delete_item(3)
+
+    page = await repo.search_items("item-", "prefix", skip=1, limit=2)
+
+    assert [item.id for item in page] == [4, 5]  # nosec
+    assert [item.id for item in await repo.search_items("other", "exact")] == [1]  # nosec
+
+
+class RecordingConnection:
+    """Records the parameters of each statement and returns one fixed row."""
+
+    def __init__(self) -> None:
+        self.params: list[tuple[Any, ...]] = []
+
+    async def fetchrow(self, query: str, *params: Any) -> dict[str, Any]:
+        self.params.append(params)
+        now = datetime.now(UTC)
+        return {"id": 1, "name": "item", "created_at": now, "updated_at": now}
+
+    async def fetch(self, query: str, *params: Any) -> list[dict[str, Any]]:
+        self.params.append(params)
+        return []
+
+
+class RecordingPool:
+    def __init__(self) -> None:
+        self.conn = RecordingConnection()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[RecordingConnection]:
+        yield self.conn
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_postgres_writes_bind_naive_datetimes_as_utc() -> None:
+    pool = RecordingPool()
+    repo = PostgresItemsRepository(cast(DatabasePool, pool))
+    naive = datetime(2024, 1, 2, 3, 4, 5)
+    aware = naive.replace(tzinfo=UTC)
+    item = Item(name="item", created_at=naive, updated_at=naive)
+
+    await repo.add_item(item)
+    await repo.add_items([item])
+    await repo.update_item(1, item, expected_updated_at=naive)
+
+    insert, bulk_insert, update = pool.conn.params
+    assert insert[1:] == (aware, aware)  # nosec
+    assert bulk_insert[1:] == ([aware], [aware])  # nosec
+    assert update[2:] == (aware, aware)  # nosec
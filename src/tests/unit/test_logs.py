@@ -0,0 +1,55 @@
+import io
+import json
+import threading
+
+import pytest
+import structlog
+
+from src.app.config import Settings
+from src.app.logs import QueueSink, configure_logging, log_events_dropped
+
+
+@pytest.mark.unit
+def test_events_are_rendered_by_the_writer() -> None:
+    stream = io.StringIO()
+    sink = configure_logging(Settings(LOG_FORMAT="json", APP_LOG_LEVEL="INFO"), stream)
+    logger = structlog.get_logger("test")
+    logger.debug("filtered")
+    logger.info("request_completed", status_code=200)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("request_failed")
+    sink.close()
+    structlog.reset_defaults()
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["event"] for event in events] == ["request_completed", "request_failed"]  # nosec
+    assert events[0]["level"] == "info" and "timestamp" in events[0]  # nosec
+    assert "ValueError: boom" in events[1]["exception"]  # nosec
+
+
+class BlockedStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.unblocked.wait(5)
+        return super().write(text)
+
+
+@pytest.mark.unit
+def test_full_queue_drops_and_counts() -> None:
+    stream = BlockedStream()
+    sink = QueueSink(stream, maxsize=1)
+    dropped = log_events_dropped.labels(level="info")
+    before = dropped._value.get()
+
+    # The stalled writer holds at most one event and the queue one more
+    for _ in range(10):
+        sink.put({"event": "flood", "level": "info"})
+    stream.unblocked.set()
+    sink.close()
+
+    assert dropped._value.get() - before >= 8  # nosec
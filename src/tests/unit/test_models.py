@@ -0,0 +1,41 @@
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from src.app.config import settings
+from src.app.main import create_app
+from src.app.models import Item
+
+
+@pytest.mark.unit
+def test_item_name_fits_the_column() -> None:
+    assert Item(name="x" * 255).name == "x" * 255  # nosec
+    with pytest.raises(ValidationError):
+        Item(name="x" * 256)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("method", "path", "body"),
+    [
+        ("POST", "/api/v1/items", {"name": "x" * 256}),
+        ("PUT", "/api/v1/items/1", {"name": "x" * 256}),
+        ("POST", "/api/v1/items/bulk", [{"name": "ok"}, {"name": "x" * 256}]),
+    ],
+)
+def test_long_names_are_rejected_with_422(method: str, path: str, body: object) -> None:
+    client = TestClient(create_app())
+
+    response = client.request(method, path, json=body, headers={"X-API-Key": settings.API_KEY})
+
+    assert response.status_code == 422  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", ["skip=-1", "limit=-1", "limit=0", "limit=1001"])
+def test_out_of_range_pages_are_rejected_with_422(query: str) -> None:
+    client = TestClient(create_app())
+
+    response = client.get(f"/api/v1/items?{query}", headers={"X-API-Key": settings.API_KEY})
+
+    assert response.status_code == 422  # nosec
@@ -0,0 +1,115 @@
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi.testclient import TestClient
+from jwt.algorithms import ECAlgorithm
+
+from src.app import main
+from src.app.api import views
+from src.app.auth import ApiKeyRegistry, JwtVerifier, digest
+from src.app.config import Settings, settings
+from src.app.ratelimit import Rate, TokenBucketLimiter, client_key
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("100/minute", Rate(100, 60)), ("5/seconds", Rate(5, 1)), (" 2 / Hour ", Rate(2, 3600))],
+)
+def test_rate_parse(value: str, expected: Rate) -> None:
+    assert Rate.parse(value) == expected  # nosec
+
+
+@pytest.mark.unit
+def test_rate_parse_rejects_unknown_units() -> None:
+    with pytest.raises(ValueError, match="Invalid rate limit"):
+        Rate.parse("100/fortnight")
+
+
+@pytest.mark.unit
+def test_token_bucket_rejects_once_exhausted() -> None:
+    limiter = TokenBucketLimiter(Rate(2, 60))
+
+    results = [limiter.hit("client") for _ in range(3)]
+
+    assert [result.allowed for result in results] == [True, True, False]  # nosec
+    assert results[-1].headers()["Retry-After"] == "30"  # nosec
+    assert limiter.hit("other-client").allowed  # nosec
+
+
+@pytest.mark.unit
+def test_client_key_prefers_verified_key_ids() -> None:
+    assert client_key("client1", "10.0.0.1") == "key:client1"  # nosec
+    assert client_key(None, "10.0.0.1") == "ip:10.0.0.1"  # nosec
+    token_digest = digest("token")
+    assert client_key(None, "10.0.0.1", token_digest) == f"token:{token_digest.hex()[:32]}"  # nosec
+
+
+def limited_client(
+    monkeypatch: pytest.MonkeyPatch, rate: str, tokens: JwtVerifier | None = None
+) -> TestClient:
+    """An app limited to ``rate``, with fresh verifiers (the limiter falls back in-process)."""
+    keys = ApiKeyRegistry()
+    tokens = tokens or JwtVerifier()
+    monkeypatch.setattr(main, "api_keys", keys)
+    monkeypatch.setattr(views, "api_keys", keys)
+    monkeypatch.setattr(main, "jwt_verifier", tokens)
+    monkeypatch.setattr(views, "jwt_verifier", tokens)
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "API_RATE_LIMIT", rate)
+    return TestClient(main.create_app())
+
+
+@pytest.mark.unit
+def test_unverified_keys_share_the_client_ip_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = limited_client(monkeypatch, "2/minute")
+
+    def get(key: str) -> int:
+        return client.get("/api/v1/items", headers={"X-API-Key": key}).status_code
+
+    # The first use of a valid key counts against the IP; once verified it has its own bucket
+    assert [get(settings.API_KEY) for _ in range(3)] == [200, 200, 200]  # nosec
+    assert [get(f"guess-{i}") for i in range(3)] == [403, 429, 429]  # nosec
+
+
+@pytest.mark.unit
+def test_verified_bearer_tokens_get_their_own_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = {**ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True), "alg": "ES256"}
+    tokens = JwtVerifier(Settings(JWT_JWKS=json.dumps({"keys": [jwk]})))
+    client = limited_client(monkeypatch, "2/minute", tokens)
+
+    def get(token: str) -> int:
+        headers = {"Authorization": f"Bearer {token}"}
+        return client.get("/api/v1/items", headers=headers).status_code
+
+    first, second, third = (
+        jwt.encode({"sub": subject, "exp": int(time.time()) + 60}, private_key, "ES256")
+        for subject in ("client-1", "client-2", "client-3")
+    )
+
+    # Each token's first request counts against the shared IP, later ones against the token
+    assert [get(first) for _ in range(3)] == [200, 200, 200]  # nosec
+    assert [get(second) for _ in range(3)] == [200, 200, 200]  # nosec
+    assert get(third) == 429  # nosec
+
+
+@pytest.mark.unit
+def test_rate_limited_responses_carry_cors_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = limited_client(monkeypatch, "1/minute")
+    origin = {"Origin": "https://app.example"}
+
+    for _ in range(3):
+        preflight = client.options(
+            "/api/v1/items", headers={**origin, "Access-Control-Request-Method": "GET"}
+        )
+        assert preflight.status_code == 200  # nosec
+    first = client.get("/api/v1/items", headers=origin)
+    limited = client.get("/api/v1/items", headers=origin)
+
+    assert first.status_code == 403  # nosec
+    assert limited.status_code == 429  # nosec
+    assert "access-control-allow-origin" in limited.headers  # nosec
@@ -0,0 +1,40 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.app.api.responses import TypedJSONResponse, typed_response
+from src.app.config import settings
+from src.app.models import Item
+from src.app.repositories import item_list_adapter
+
+
+@pytest.mark.unit
+def test_typed_response_matches_jsonable_encoding() -> None:
+    created = datetime(2024, 1, 1, 12, 30)
+    items = [Item(id=1, name="first", created_at=created, updated_at=created)]
+
+    response = TypedJSONResponse(items, item_list_adapter)
+
+    assert response.headers["content-type"] == "application/json"  # nosec
+    assert json.loads(bytes(response.body)) == [  # nosec
+        {
+            "id": 1,
+            "name": "first",
+            "created_at": "2024-01-01T12:30:00",
+            "updated_at": "2024-01-01T12:30:00",
+        }
+    ]
+
+
+@pytest.mark.unit
+def test_typed_response_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    items = [Item(name="first")]
+
+    monkeypatch.setattr(settings, "FEATURE_FAST_JSON", False)
+    plain = typed_response(items, item_list_adapter)
+    monkeypatch.setattr(settings, "FEATURE_FAST_JSON", True)
+    fast = typed_response(items, item_list_adapter)
+
+    assert plain is items  # nosec
+    assert isinstance(fast, TypedJSONResponse)  # nosec
@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.config import settings
+from src.app.main import create_app
+from src.app.search import NameIndex, SortedList
+
+
+@pytest.mark.unit
+def test_sorted_strings_across_chunks() -> None:
+    strings: SortedList[str] = SortedList(chunk_size=2)
+    for value in ["m", "c", "x", "a", "q", "f", "c", "z"]:
+        strings.add(value)
+    strings.discard("q")
+    strings.discard("missing")
+
+    assert list(strings) == ["a", "c", "f", "m", "x", "z"]  # nosec
+    assert list(strings.iter_from("d")) == ["f", "m", "x", "z"]  # nosec
+    assert list(strings.iter_from("zz")) == []  # nosec
+    assert strings.at(1, 4) == ["c", "f", "m"]  # nosec
+    assert strings.at(4, 10) == ["x", "z"]  # nosec
+    assert strings.at(6, 8) == []  # nosec
+
+
+@pytest.mark.unit
+def test_search_orders_by_name_then_id() -> None:
+    index = NameIndex()
+    for item_id, name in enumerate(["banana", "apple pie", "apple", "pineapple", "apple"], 1):
+        index.add(name, item_id)
+
+    assert index.search("apple", "exact", 10) == [3, 5]  # nosec
+    assert index.search("apple", "prefix", 10) == [3, 5, 2]  # nosec
+    assert index.search("apple", "substring", 10) == [3, 5, 2, 4]  # nosec
+    assert index.search("apple", "substring", 2) == [3, 5]  # nosec
+    # Shorter than a trigram: every name is checked
+    assert index.search("an", "substring", 10) == [1]  # nosec
+
+
+@pytest.mark.unit
+def test_search_follows_renames_and_removals() -> None:
+    index = NameIndex()
+    for item_id in range(1, 5):
+        index.add(f"item-{item_id}", item_id)
+    index.remove(2)
+    index.remove(3)
+    index.add("item-renamed", 3)
+
+    assert index.search("item-", "prefix", 10) == [1, 4, 3]  # nosec
+    assert index.search("item", "substring", 10) == [1, 4, 3]  # nosec
+    assert index.search("item-2", "exact", 10) == []  # nosec
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("q", "match", "status_code"),
+    [("ab", "substring", 422), ("abc", "substring", 200), ("a", "prefix", 200)],
+)
+def test_short_substring_queries_are_rejected(q: str, match: str, status_code: int) -> None:
+    client = TestClient(create_app())
+
+    response = client.get(
+        "/api/v1/items/search",
+        params={"q": q, "match": match},
+        headers={"X-API-Key": settings.API_KEY},
+    )
+
+    assert response.status_code == status_code  # nosec
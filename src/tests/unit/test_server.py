@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from src.app.config import Settings
+from src.app.server import cgroup_cpu_limit, worker_count
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("cpu_max", "expected"), [("150000 100000", 1.5), ("max 100000", None)])
+def test_cgroup_v2_cpu_limit(tmp_path: Path, cpu_max: str, expected: float | None) -> None:
+    (tmp_path / "cpu.max").write_text(cpu_max)
+
+    assert cgroup_cpu_limit(tmp_path) == expected  # nosec
+
+
+@pytest.mark.unit
+def test_cgroup_v1_cpu_limit(tmp_path: Path) -> None:
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000")
+
+    assert cgroup_cpu_limit(tmp_path) == 2.0  # nosec
+
+
+@pytest.mark.unit
+def test_worker_count_prefers_explicit_setting(tmp_path: Path) -> None:
+    (tmp_path / "cpu.max").write_text("100000 100000")
+
+    assert worker_count(Settings(SERVER_WORKERS=3), tmp_path) == 3  # nosec
+
+
+@pytest.mark.unit
+def test_worker_count_falls_back_to_container_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("os.sched_getaffinity", lambda _: set(range(8)))
+
+    assert worker_count(Settings(CONTAINER_CPU_LIMIT="2.5"), tmp_path) == 3  # nosec
+    assert worker_count(Settings(CONTAINER_CPU_LIMIT="0.25"), tmp_path) == 1  # nosec
+    assert worker_count(Settings(CONTAINER_CPU_LIMIT="32"), tmp_path) == 8  # nosec
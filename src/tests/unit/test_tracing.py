@@ -0,0 +1,24 @@
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from src.app.config import Settings
+from src.app.tracing import create_tracer_provider
+
+
+@pytest.mark.unit
+def test_no_provider_without_exporter() -> None:
+    assert create_tracer_provider(Settings(OTEL_EXPORTER="none")) is None  # nosec
+
+
+@pytest.mark.unit
+def test_provider_samples_by_ratio() -> None:
+    exporter = InMemorySpanExporter()
+    provider = create_tracer_provider(Settings(OTEL_SAMPLE_RATIO=0.0), exporter)
+    assert provider is not None  # nosec
+
+    with provider.get_tracer(__name__).start_as_current_span("dropped") as span:
+        assert not span.is_recording()  # nosec
+    provider.shutdown()
+
+    assert "TraceIdRatioBased{0.0}" in provider.sampler.get_description()  # nosec
+    assert exporter.get_finished_spans() == ()  # nosec